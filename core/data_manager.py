@@ -1049,6 +1049,34 @@ class DataManager:
             logger.error(f"Error setting app setting: {str(e)}")
             raise
     
+    def set_app_settings(self, settings: Dict[str, str]) -> bool:
+        """
+        Set several global application settings in one transaction.
+        
+        Args:
+            settings: Dictionary mapping setting keys to values
+            
+        Returns:
+            True if successful
+        """
+        try:
+            conn = self._get_connection()
+            
+            # One commit for the whole batch instead of one per setting
+            with conn:
+                conn.executemany('''
+                INSERT OR REPLACE INTO app_settings (setting_key, setting_value)
+                VALUES (?, ?)
+                ''', settings.items())
+            
+            conn.close()
+            
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"Error setting app settings: {str(e)}")
+            raise
+    
     def get_app_setting(self, key: str) -> Optional[str]:
         """
         Get a global application setting.
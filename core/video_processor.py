@@ -5,6 +5,8 @@ import logging
 from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot, QMutex, QWaitCondition
 from typing import Dict, List, Tuple, Optional, Union
 
+from utils.helpers import camera_backend
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -328,7 +330,7 @@ class VideoThread(QThread):
         """Thread's main loop."""
         try:
             # Open webcam
-            cap = cv2.VideoCapture(self.camera_id)
+            cap = cv2.VideoCapture(self.camera_id, camera_backend())
             
             if not cap.isOpened():
                 self.error_occurred.emit(f"Failed to open camera {self.camera_id}")
@@ -3,20 +3,21 @@ import os
 import logging
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 
 # Import application modules
 from core.data_manager import DataManager
 from ui.main_window import MainWindow
-from utils.constants import APP_NAME, APP_VERSION, LOG_FORMAT, DATABASE_PATH
+from utils.constants import (
+    APP_NAME, APP_VERSION, LOG_FORMAT, DATABASE_PATH, LOG_DIR, PIXMAP_CACHE_LIMIT_KB
+)
 from utils.helpers import ensure_app_directories
 
 def setup_logging():
     """Configure application logging."""
-    log_dir = os.path.join(os.path.expanduser("~"), ".shooting_analyzer", "logs")
-    os.makedirs(log_dir, exist_ok=True)
+    os.makedirs(LOG_DIR, exist_ok=True)
     
-    log_file = os.path.join(log_dir, "app.log")
+    log_file = os.path.join(LOG_DIR, "app.log")
     
     logging.basicConfig(
         level=logging.INFO,
@@ -29,12 +30,26 @@ def setup_logging():
     
     return logging.getLogger(__name__)
 
+def set_timer_resolution():
+    """Request 1 ms timer resolution on Windows so sleeps wake on time."""
+    if sys.platform != 'win32':
+        return
+    
+    try:
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    except Exception:
+        pass
+
 def main():
     """Main application entry point."""
     # Set up logging
     logger = setup_logging()
     logger.info(f"Starting {APP_NAME} v{APP_VERSION}")
     
+    # Improve sleep precision for video playback pacing
+    set_timer_resolution()
+    
     # Ensure application directories exist
     ensure_app_directories()
     
@@ -50,6 +65,9 @@ def main():
     # Set application style
     app.setStyle("Fusion")
     
+    # Allow up to 128 MB of cached pixmaps (used by session replay)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+    
     # Create and show main window
     main_window = MainWindow(db_manager)
     main_window.show()
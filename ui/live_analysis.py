@@ -19,8 +19,8 @@ from utils.constants import (
     COLORS
 )
 from utils.helpers import (
-    cv_to_qt_pixmap, show_error_message, show_info_message,
-    get_score_color, format_duration
+    CvQtConverter, show_error_message, show_info_message,
+    get_score_color, format_duration, camera_backend
 )
 from core.audio_detector import AudioDetector
 
@@ -75,6 +75,11 @@ class LiveAnalysisWidget(QWidget):
 
         self.is_audio_enabled = False
 
+        # Converts camera frames for display through a reused RGBA buffer
+        self._qt_converter = CvQtConverter(
+            use_gpu=self.data_manager.get_app_setting('gpu_color_conversion') == 'true'
+        )
+
         # Initialize UI
         self._init_ui()
         
@@ -121,7 +126,7 @@ class LiveAnalysisWidget(QWidget):
         
         # Scan for available cameras (up to 5)
         for i in range(5):
-            cap = cv2.VideoCapture(i)
+            cap = cv2.VideoCapture(i, camera_backend())
             if cap.isOpened():
                 cap.release()
                 if i != DEFAULT_CAMERA_ID:
@@ -331,7 +336,7 @@ class LiveAnalysisWidget(QWidget):
             frame: OpenCV image frame
         """
         # Convert to QPixmap and display
-        pixmap = cv_to_qt_pixmap(frame)
+        pixmap = self._qt_converter.to_pixmap(frame)
         
         # Scale pixmap to fit the label while maintaining aspect ratio
         scaled_pixmap = pixmap.scaled(
@@ -663,7 +668,7 @@ class LiveAnalysisWidget(QWidget):
         
         # Scan for available cameras (up to 5)
         for i in range(5):
-            cap = cv2.VideoCapture(i)
+            cap = cv2.VideoCapture(i, camera_backend())
             if cap.isOpened():
                 cap.release()
                 if i != DEFAULT_CAMERA_ID:
@@ -721,6 +726,15 @@ class LiveAnalysisWidget(QWidget):
         # Start new recording
         self._start_recording()
     
+    def set_gpu_color_conversion(self, enabled):
+        """
+        Turn GPU colour conversion of large frames on or off.
+        
+        Args:
+            enabled: Whether large frames may be converted on the GPU
+        """
+        self._qt_converter.set_use_gpu(enabled)
+    
     def cleanup(self):
         """Clean up resources before widget is destroyed."""
         # Stop video thread
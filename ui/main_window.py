@@ -10,7 +10,7 @@ from PyQt6.QtGui import QIcon, QAction, QFont
 
 from utils.constants import (
     UI_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, 
-    STYLESHEET_LIGHT, STYLESHEET_DARK
+    STYLESHEET_LIGHT_MIN, STYLESHEET_DARK_MIN
 )
 from utils.helpers import show_info_message, show_error_message, get_icon
 
@@ -226,6 +226,9 @@ class MainWindow(QMainWindow):
         self.widgets['settings'] = SettingsWidget(self.data_manager)
         self.stacked_widget.addWidget(self.widgets['settings'])
         
+        # Connect settings change signal
+        self.widgets['settings'].settings_changed.connect(self._on_settings_changed)
+        
         # Add content to main layout
         self.main_layout.addWidget(self.content)
         
@@ -336,6 +339,17 @@ class MainWindow(QMainWindow):
 
         logger.info(f"Navigated to {page_name}")
     
+    def _on_settings_changed(self, settings):
+        """
+        Apply saved settings that take effect without a restart.
+        
+        Args:
+            settings: Decoded settings from the settings page
+        """
+        use_gpu = settings.get('gpu_color_conversion', False)
+        self.widgets['live'].set_gpu_color_conversion(use_gpu)
+        self.widgets['replay'].set_gpu_color_conversion(use_gpu)
+    
     def set_current_user(self, user_id, user_name):
         """
         Set the current user.
@@ -380,10 +394,13 @@ class MainWindow(QMainWindow):
         # Get theme setting from database
         theme = self.data_manager.get_app_setting('theme') or 'light'
         
+        # Icons may be coloured for the previous theme
+        get_icon.cache_clear()
+        
         if theme == 'dark':
-            self.setStyleSheet(STYLESHEET_DARK)
+            self.setStyleSheet(STYLESHEET_DARK_MIN)
         else:
-            self.setStyleSheet(STYLESHEET_LIGHT)
+            self.setStyleSheet(STYLESHEET_LIGHT_MIN)
     
     def _check_for_users(self):
         """Check if any users exist in the database."""
@@ -4,32 +4,86 @@ import time
 import cv2
 import numpy as np
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QSlider, QComboBox, QGroupBox, QCheckBox, QSplitter,
     QTableWidget, QTableWidgetItem, QHeaderView, QFrame,
     QMessageBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QFont, QIcon, QPixmap
+from PyQt6.QtCore import Qt, QTimer, QSize, QElapsedTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QPixmapCache
 
 from core.video_processor import VideoPlayer
 from core.posture_analyzer import PostureAnalyzer
-from utils.constants import COLORS, VIDEO_WIDTH, VIDEO_HEIGHT
+from utils.constants import COLORS, VIDEO_WIDTH, VIDEO_HEIGHT, RECORDING_FPS
 from utils.helpers import (
-    cv_to_qt_pixmap, show_error_message, show_info_message,
+    CvQtConverter, show_error_message, show_info_message,
     get_score_color, format_timestamp
 )
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Joints shown in the angle panel, in display order
+JOINT_NAMES = (
+    'knees', 'hips', 'left_shoulder', 'right_shoulder', 
+    'left_elbow', 'right_elbow', 'wrists', 'neck'
+)
+
+# Joint angles are stored as int16 hundredths of a degree
+ANGLE_SCALE = 100
+ANGLE_MISSING = np.iinfo(np.int16).min
+
+# Forward jumps up to this many frames are reached with grab() instead of a seek
+SEEK_GRAB_LIMIT = 8
+
+# Decoded frames the playback thread may queue ahead of the display
+FRAME_QUEUE_SIZE = 3
+
+# Reusable decode buffers: the queued frames, the one being decoded and
+# the one the GUI thread is converting
+FRAME_POOL_SIZE = FRAME_QUEUE_SIZE + 2
+
+# Longest the GUI thread waits for the playback thread to let go of the
+# capture when closing
+CAP_RELEASE_TIMEOUT_S = 0.5
+
+# Frames decoded ahead of the slider position when scrubbing starts
+SCRUB_PREFETCH_FRAMES = 30
+
+# How long prefetched scrub frames are kept after the slider is released,
+# so a quick re-grab reuses them
+SCRUB_CACHE_LINGER_MS = 2000
+
+# Pacing sleeps until this close to a deadline, then spins the rest
+PACING_SPIN_NS = 1_000_000
+
+
+class PlaybackSync:
+    """Stop and pacing state shared by one run of the playback threads."""
+
+    def __init__(self):
+        # Set to ask the playback and pacing threads to exit
+        self.stop = threading.Event()
+        # Frame deadlines published by the pacing thread to the playback thread
+        self.tick = threading.Event()
+        self.ticks = 0
+
+
 class ReplayWidget(QWidget):
     """
     Widget for session replay screen.
     Allows reviewing recorded sessions with detailed analysis.
     """
     
+    # Emitted by the video playback thread when it reaches the end
+    playback_finished = pyqtSignal()
+    
+    # Emitted by the video playback thread when decoding fails
+    decode_error = pyqtSignal(str)
+    
     def __init__(self, data_manager):
         """
         Initialize the replay widget.
@@ -41,12 +95,17 @@ class ReplayWidget(QWidget):
         
         # Store data manager
         self.data_manager = data_manager
+
+        # Worker pool for overlapping session database queries
+        self._db_executor = ThreadPoolExecutor(max_workers=2)
         
         # Initialize video player
         self.video_player = VideoPlayer()
         
         # Initialize posture analyzer for reference angles
         self.posture_analyzer = PostureAnalyzer()
+        ideal_angles = self.posture_analyzer.ideal_angles
+        self._ideal_vec = np.array([ideal_angles.get(joint, 0) for joint in JOINT_NAMES])
         
         # Current user ID
         self.current_user_id = None
@@ -59,7 +118,13 @@ class ReplayWidget(QWidget):
         # Playback state
         self.is_playing = False
         self.current_frame_index = 0
-        self.last_frame_time = 0
+        
+        # Clock for drift-corrected image playback
+        self._frame_clock = QElapsedTimer()
+        self._frames_played = 0
+        
+        # Set while _show_frame moves the slider to the displayed frame
+        self._syncing_slider = False
         
         # Display options
         self.show_keypoints = True
@@ -71,14 +136,66 @@ class ReplayWidget(QWidget):
         
         # Initialize playback timer
         self.playback_timer = QTimer(self)
+        self.playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.playback_timer.timeout.connect(self._play_next_frame)
-        self.playback_timer.setInterval(100)  # 10 fps playback
+        self.playback_timer.setInterval(int(1000 / RECORDING_FPS))
+
+        # Decoded video frames are queued by the playback thread and
+        # displayed by a timer on the GUI thread
+        self._frame_queue = deque(maxlen=FRAME_QUEUE_SIZE)
+        self._queue_lock = threading.Lock()
+        self.display_timer = QTimer(self)
+        self.display_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.display_timer.timeout.connect(self._drain_frame_queue)
+        self.playback_finished.connect(
+            self._on_playback_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.decode_error.connect(
+            self._on_decode_error, Qt.ConnectionType.QueuedConnection
+        )
+
+        # Preallocated buffers the playback thread decodes into
+        self._frame_pool = []
+
+        # Converts frames for display through a reused RGBA buffer
+        self._qt_converter = CvQtConverter(
+            use_gpu=data_manager.get_app_setting('gpu_color_conversion') == 'true'
+        )
+
+        # Frames decoded ahead of the slider while scrubbing, keyed by index
+        self._scrub_cache = {}
+        # Frame range (start, end) the running or finished prefetch covers
+        self._scrub_window = None
+        self._prefetch_generation = 0
+        self._scrub_release_timer = QTimer(self)
+        self._scrub_release_timer.setSingleShot(True)
+        self._scrub_release_timer.setInterval(SCRUB_CACHE_LINGER_MS)
+        self._scrub_release_timer.timeout.connect(self._clear_scrub_cache)
 
         self.video_cap = None
+        self._last_decoded_index = None
         self.video_thread = None
-        self.stop_video_thread = False
+        self.pacing_thread = None
+        # Stop and pacing state of the running playback threads
+        self._playback_sync = None
+        # Guards video_cap between the playback thread and the GUI thread
+        self._cap_lock = threading.Lock()
         self.current_video_path = None
-        self.frame_rate = 15
+        self.frame_rate = RECORDING_FPS
+
+        # Per-frame image source lookup, built in _classify_frame_sources
+        self._frame_source = None
+        self._source_fns = ()
+
+        # Quantized joint angles (frames x joints), built in _quantize_joint_angles
+        self._angles_mat_q = None
+
+        # Session info HTML template, built in _build_session_info_template
+        self._session_info_tmpl = None
+
+        # Reusable placeholder buffers (blank base and a scratch copy to draw on)
+        self._placeholder_base = np.zeros((480, 640, 3), dtype=np.uint8)
+        self._placeholder_scratch = np.empty_like(self._placeholder_base)
         
         logger.info("ReplayWidget initialized")
     
@@ -155,6 +272,8 @@ class ReplayWidget(QWidget):
         self.frame_slider.setMaximum(100)
         self.frame_slider.setValue(0)
         self.frame_slider.valueChanged.connect(self._slider_moved)
+        self.frame_slider.sliderPressed.connect(self._start_scrub_prefetch)
+        self.frame_slider.sliderReleased.connect(self._on_slider_released)
         slider_layout.addWidget(self.frame_slider)
         
         self.frame_counter = QLabel("0/0")
@@ -231,22 +350,14 @@ class ReplayWidget(QWidget):
         angles_scroll = QScrollArea()
         angles_scroll.setWidgetResizable(True)
         angles_content = QWidget()
-        angles_layout = QVBoxLayout(angles_content)
+        self.angles_layout = QVBoxLayout(angles_content)
         
-        # Create frames for each joint
+        # Joint frames are built on the first angle update (see _build_angle_frames)
         self.angle_frames = {}
-        joint_names = [
-            'knees', 'hips', 'left_shoulder', 'right_shoulder', 
-            'left_elbow', 'right_elbow', 'wrists', 'neck'
-        ]
-        
-        for joint in joint_names:
-            frame = self._create_joint_angle_frame(joint)
-            self.angle_frames[joint] = frame
-            angles_layout.addWidget(frame)
+        self._angle_frames_built = False
         
         angles_scroll.setWidget(angles_content)
-        angles_layout.addStretch()
+        self.angles_layout.addStretch()
         
         right_layout.addWidget(angles_scroll)
         
@@ -256,6 +367,16 @@ class ReplayWidget(QWidget):
         # Set initial splitter sizes
         self.splitter.setSizes([int(self.width() * 0.6), int(self.width() * 0.4)])
     
+    def _build_angle_frames(self):
+        """Create the per-joint angle frames the first time they are needed."""
+        # Insert frames above the trailing stretch
+        for joint in JOINT_NAMES:
+            frame = self._create_joint_angle_frame(joint)
+            self.angle_frames[joint] = frame
+            self.angles_layout.insertWidget(self.angles_layout.count() - 1, frame)
+        
+        self._angle_frames_built = True
+    
     def _create_joint_angle_frame(self, joint_name):
         """
         Create a frame for displaying joint angle information.
@@ -398,6 +519,11 @@ class ReplayWidget(QWidget):
             # Store session ID
             self.current_session_id = session_id
 
+            # Start fetching the frame data while the session record is handled here
+            data_future = self._db_executor.submit(
+                self.data_manager.get_session_data, session_id
+            )
+
             # Get session data
             self.current_session = self.data_manager.get_session(session_id)
 
@@ -424,8 +550,8 @@ class ReplayWidget(QWidget):
             else:
                 self.current_video_path = None
 
-            # Get detailed session data
-            self.session_data = self.data_manager.get_session_data(session_id)
+            # Wait for the detailed session data
+            self.session_data = data_future.result()
 
             if not self.session_data:
                 show_error_message(self, "Session Error", 
@@ -433,6 +559,7 @@ class ReplayWidget(QWidget):
                 return
 
             # Update UI with session info
+            self._build_session_info_template()
             self._update_session_info()
 
             # Prepare video player
@@ -453,6 +580,10 @@ class ReplayWidget(QWidget):
         self.current_session = None
         self.session_data = None
         self.current_frame_index = 0
+        self._session_info_tmpl = None
+        
+        # Drop frames prefetched for scrubbing
+        self._clear_scrub_cache()
         
         # Stop playback
         self._stop_playback()
@@ -485,33 +616,54 @@ class ReplayWidget(QWidget):
             frame.current_value.setStyleSheet("")
             frame.diff_value.setStyleSheet("")
     
+    def _build_session_info_template(self):
+        """
+        Build the session info HTML template for the loaded session.
+
+        Optional rows are decided once here so _update_session_info only
+        has to fill in values.
+        """
+        session = self.current_session
+        tmpl = "<b>Session:</b> {name}<br>"
+        tmpl += "<b>Date:</b> {date}<br>"
+        
+        if session.get('duration'):
+            tmpl += "<b>Duration:</b> {duration_min}:{duration_sec:02d}<br>"
+        
+        if session.get('overall_score'):
+            tmpl += "<b>Overall Score:</b> {overall_score:.1f}<br>"
+        
+        if session.get('posture_quality'):
+            tmpl += "<b>Posture Quality:</b> {posture_quality}<br>"
+        
+        if session.get('stability'):
+            tmpl += "<b>Stability:</b> {stability}<br>"
+        
+        if self.session_data:
+            tmpl += "<b>Frames:</b> {frames}<br>"
+        
+        self._session_info_tmpl = tmpl
+    
     def _update_session_info(self):
         """Update the session information display."""
         if not self.current_session:
             self.session_info.setText("No session loaded")
             return
         
-        # Format session info text
-        info_text = f"<b>Session:</b> {self.current_session['name']}<br>"
-        info_text += f"<b>Date:</b> {format_timestamp(self.current_session['timestamp'])}<br>"
+        if self._session_info_tmpl is None:
+            self._build_session_info_template()
         
-        if self.current_session.get('duration'):
-            minutes, seconds = divmod(self.current_session['duration'], 60)
-            info_text += f"<b>Duration:</b> {minutes}:{seconds:02d}<br>"
+        # Fill the per-session template
+        minutes, seconds = divmod(self.current_session.get('duration') or 0, 60)
+        values = dict(
+            self.current_session,
+            date=format_timestamp(self.current_session['timestamp']),
+            duration_min=minutes,
+            duration_sec=seconds,
+            frames=len(self.session_data) if self.session_data else 0
+        )
         
-        if self.current_session.get('overall_score'):
-            info_text += f"<b>Overall Score:</b> {self.current_session['overall_score']:.1f}<br>"
-        
-        if self.current_session.get('posture_quality'):
-            info_text += f"<b>Posture Quality:</b> {self.current_session['posture_quality']}<br>"
-        
-        if self.current_session.get('stability'):
-            info_text += f"<b>Stability:</b> {self.current_session['stability']}<br>"
-        
-        if self.session_data:
-            info_text += f"<b>Frames:</b> {len(self.session_data)}<br>"
-        
-        self.session_info.setText(info_text)
+        self.session_info.setText(self._session_info_tmpl.format_map(values))
     
     def _prepare_playback(self):
         """Prepare the video player for playback."""
@@ -533,15 +685,18 @@ class ReplayWidget(QWidget):
 
         # Close existing video capture if any
         if self.video_cap is not None:
-            self.video_cap.release()
+            with self._cap_lock:
+                self.video_cap.release()
             self.video_cap = None
+        self._frame_pool = []
+
+        # Sessions without a video play back at the recording frame rate
+        self.frame_rate = RECORDING_FPS
 
         # Initialize video capture if video path exists
         if self.current_video_path and os.path.exists(self.current_video_path):
             try:
-                self.video_cap = cv2.VideoCapture(self.current_video_path)
-
-                if self.video_cap.isOpened():
+                if self._open_video_capture():
                     # Get video properties
                     fps = self.video_cap.get(cv2.CAP_PROP_FPS)
                     if fps > 0:
@@ -550,26 +705,247 @@ class ReplayWidget(QWidget):
                     frame_count = int(self.video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
                     logger.info(f"Opened video with {frame_count} frames at {self.frame_rate} FPS")
 
-                    # Reset to first frame
-                    self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                else:
-                    logger.warning(f"Failed to open video file: {self.current_video_path}")
-                    self.video_cap = None
+                    # Allocate decode buffers once per video
+                    width = int(self.video_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                    height = int(self.video_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                    self._frame_pool = [
+                        np.empty((height, width, 3), dtype=np.uint8)
+                        for _ in range(FRAME_POOL_SIZE)
+                    ]
             except Exception as e:
                 logger.error(f"Error initializing video capture: {str(e)}")
                 self.video_cap = None
 
+        # Pace image playback at the session frame rate
+        self.playback_timer.setInterval(int(1000 / self.frame_rate))
+
+        # Resolve where each frame's image comes from
+        self._classify_frame_sources()
+
+        # Pack joint angles into a compact matrix for per-frame display
+        self._quantize_joint_angles()
+
         # Display first frame
         self._show_frame(0)
 
+    def _open_video_capture(self):
+        """
+        Open the current session video into self.video_cap.
+
+        Returns:
+            True if the video was opened, positioned at the first frame
+        """
+        video_cap = self._open_video_file(self.current_video_path)
+
+        if not video_cap.isOpened():
+            logger.warning(f"Failed to open video file: {self.current_video_path}")
+            self.video_cap = None
+            return False
+
+        # Keep the decoder queue to a single frame so seeks and
+        # resumes never deliver stale buffered frames
+        video_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Reset to first frame
+        video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._last_decoded_index = -1
+
+        self.video_cap = video_cap
+        return True
+
+    @staticmethod
+    def _open_video_file(video_path):
+        """
+        Open a video file for decoding.
+
+        Args:
+            video_path: Path of the video file
+
+        Returns:
+            cv2.VideoCapture, which may have failed to open
+        """
+        # Ask for FFmpeg directly rather than probing every backend;
+        # fall back to OpenCV's default choice if it is unavailable
+        video_cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        if not video_cap.isOpened():
+            video_cap = cv2.VideoCapture(video_path)
+
+        return video_cap
+
+    def _classify_frame_sources(self):
+        """
+        Decide once per session which image source each frame uses.
+
+        Sources are indexed into self._source_fns:
+        0 = video file, 1 = preloaded frame_image, 2 = frame_path, 3 = placeholder
+        """
+        self._source_fns = (
+            self._decode_video,
+            self._decode_preloaded,
+            self._decode_path,
+            self._make_placeholder
+        )
+
+        n = len(self.session_data)
+        self._frame_source = np.empty(n, dtype=np.uint8)
+
+        if self.video_cap is not None and self.video_cap.isOpened():
+            self._frame_source.fill(0)
+            return
+
+        for i, frame_data in enumerate(self.session_data):
+            if frame_data.get('frame_image') is not None:
+                self._frame_source[i] = 1
+            elif frame_data.get('frame_path'):
+                self._frame_source[i] = 2
+            else:
+                self._frame_source[i] = 3
+
+    def _quantize_joint_angles(self):
+        """
+        Pack the session's joint angles into an int16 matrix.
+
+        Angles are stored in hundredths of a degree with ANGLE_MISSING
+        marking joints that were not measured in a frame.
+        """
+        nan = float('nan')
+
+        # Gather every angle into one float matrix, NaN where unmeasured
+        rows = [
+            [angle if isinstance(angle, (int, float)) else nan
+             for angle in map((frame_data.get('joint_angles') or {}).get, JOINT_NAMES)]
+            for frame_data in self.session_data
+        ]
+        angles = np.array(rows, dtype=np.float64).reshape(len(rows), len(JOINT_NAMES))
+
+        # Scale, round and clip the whole matrix at once
+        missing = np.isnan(angles)
+        scaled = np.clip(np.rint(angles * ANGLE_SCALE), ANGLE_MISSING + 1, np.iinfo(np.int16).max)
+        scaled[missing] = ANGLE_MISSING
+
+        self._angles_mat_q = scaled.astype(np.int16)
+
+    def _seek_video(self, frame_index):
+        """
+        Position the video capture so the next grab() returns frame_index.
+
+        CAP_PROP_POS_FRAMES seeks rewind to a keyframe and decode forward, so
+        they are skipped when the capture is already there and replaced by
+        grab() calls for short forward jumps.
+
+        Args:
+            frame_index: Index of the frame to decode next
+
+        Returns:
+            Index of the frame the next grab() will return
+        """
+        if self._last_decoded_index is not None:
+            ahead = frame_index - (self._last_decoded_index + 1)
+
+            if ahead == 0:
+                return frame_index
+
+            if 0 < ahead <= SEEK_GRAB_LIMIT:
+                for _ in range(ahead):
+                    self.video_cap.grab()
+                return frame_index
+
+        # Backends may land near rather than on the target after a seek
+        self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        return int(self.video_cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+    def _decode_video(self, frame_index):
+        """Read a frame from the session video, falling back to stored images."""
+        # Serve scrubbing from frames prefetched into RAM
+        frame = self._scrub_cache.get(frame_index)
+        if frame is not None:
+            return frame
+
+        # Seek to the correct frame; a stopping playback thread may still
+        # be finishing a grab on the same capture
+        with self._cap_lock:
+            pos = self._seek_video(frame_index)
+            ret, frame = self.video_cap.read()
+
+        if ret:
+            # Track where the stream really is; an inexact seek may have
+            # landed off the requested frame
+            self._last_decoded_index = pos
+            return frame
+
+        # Stream position is unknown after a failed read
+        self._last_decoded_index = None
+        return self._decode_preloaded(frame_index)
+
+    def _decode_preloaded(self, frame_index):
+        """Return the preloaded frame image, falling back to frame_path."""
+        frame = self.session_data[frame_index].get('frame_image')
+
+        if frame is not None:
+            return frame
+
+        return self._decode_path(frame_index)
+
+    def _decode_path(self, frame_index):
+        """Load a frame image from its frame_path on disk."""
+        frame_path = self.session_data[frame_index].get('frame_path')
+
+        if not frame_path:
+            return None
+
+        try:
+            # Construct absolute path
+            data_dir = os.path.dirname(self.data_manager.db_path)
+            abs_path = os.path.join(data_dir, frame_path)
+
+            if os.path.exists(abs_path):
+                frame = cv2.imread(abs_path)
+
+                if frame is None:
+                    logger.warning(f"Failed to load image at {abs_path}")
+
+                return frame
+
+            logger.warning(f"Image file not found at {abs_path}")
+        except Exception as e:
+            logger.error(f"Error loading frame from path: {str(e)}")
+
+        return None
+
+    def _make_placeholder(self, frame_index):
+        """Generate a placeholder image for frames without image data."""
+        posture_score = self.session_data[frame_index]['posture_score']
+
+        # Reset the scratch buffer instead of allocating a new frame
+        placeholder_frame = self._placeholder_scratch
+        np.copyto(placeholder_frame, self._placeholder_base)
+        cv2.putText(placeholder_frame, "Frame data unavailable", (50, 240), 
+                  cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        cv2.putText(placeholder_frame, f"Score: {posture_score:.1f}", 
+                  (50, 280), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        return placeholder_frame
+
     
 
-    def _show_frame(self, frame_index):
+    def _drain_frame_queue(self):
+        """Display the newest frame queued by the video playback thread."""
+        with self._queue_lock:
+            latest = self._frame_queue[-1] if self._frame_queue else None
+            self._frame_queue.clear()
+
+        if latest is not None:
+            self._show_frame(*latest)
+        elif not self.is_playing:
+            # Playback thread finished and every frame has been shown
+            self.display_timer.stop()
+
+    def _show_frame(self, frame_index, display_frame=None):
         """
         Display a specific frame from the session.
 
         Args:
             frame_index: Index of the frame to display
+            display_frame: Already decoded image for the frame, if available
         """
         if not self.session_data or frame_index < 0 or frame_index >= len(self.session_data):
             return
@@ -579,7 +955,7 @@ class ReplayWidget(QWidget):
             frame_data = self.session_data[frame_index]
 
             # Extract data
-            joint_angles = frame_data['joint_angles']
+            joint_angles = self._angles_mat_q[frame_index]
             posture_score = frame_data['posture_score']
             feedback = frame_data['feedback']
 
@@ -589,68 +965,43 @@ class ReplayWidget(QWidget):
             # Update frame counter
             self.frame_counter.setText(f"{frame_index}/{len(self.session_data) - 1}")
 
-            # Update slider (without triggering valueChanged)
-            self.frame_slider.blockSignals(True)
-            self.frame_slider.setValue(frame_index)
-            self.frame_slider.blockSignals(False)
+            # Update slider; the guard flag stops _slider_moved from treating
+            # this as a user seek. Seeks from the slider are already in place.
+            if self.frame_slider.value() != frame_index:
+                self._syncing_slider = True
+                self.frame_slider.setValue(frame_index)
+                self._syncing_slider = False
 
             # Store current index
             self.current_frame_index = frame_index
 
-            # Get the frame image - try multiple sources in order of preference:
-            # 1. Video file if available
-            # 2. Preloaded frame_image if available
-            # 3. Load from frame_path if available
-            # 4. Generate a placeholder
+            # Reuse a previously scaled pixmap for this frame if Qt still has it
+            size = self.video_frame.size()
+            flags = (int(self.show_keypoints) | int(self.show_angles) << 1 |
+                     int(self.show_ideal_overlay) << 2)
+            cache_key = (f"replay:{self.current_session_id}:{frame_index}:"
+                         f"{size.width()}x{size.height()}:{flags}")
 
-            display_frame = None
+            scaled_pixmap = QPixmapCache.find(cache_key) if display_frame is None else None
 
-            # 1. Try to get frame from video file
-            if self.video_cap is not None and self.video_cap.isOpened():
-                # Seek to the correct frame
-                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
-                ret, frame = self.video_cap.read()
+            if scaled_pixmap is None or scaled_pixmap.isNull():
+                # Get the frame image from the source chosen in _classify_frame_sources
+                if display_frame is None:
+                    display_frame = self._source_fns[self._frame_source[frame_index]](frame_index)
 
-                if ret:
-                    display_frame = frame
+                # If the source failed, generate a placeholder
+                if display_frame is None:
+                    display_frame = self._make_placeholder(frame_index)
 
-            # 2. Try to use preloaded frame_image
-            if display_frame is None and 'frame_image' in frame_data and frame_data['frame_image'] is not None:
-                display_frame = frame_data['frame_image']
-
-            # 3. Try to load from frame_path
-            if display_frame is None and 'frame_path' in frame_data and frame_data['frame_path']:
-                try:
-                    # Construct absolute path
-                    data_dir = os.path.dirname(self.data_manager.db_path)
-                    abs_path = os.path.join(data_dir, frame_data['frame_path'])
-
-                    if os.path.exists(abs_path):
-                        display_frame = cv2.imread(abs_path)
-
-                        if display_frame is None:
-                            logger.warning(f"Failed to load image at {abs_path}")
-                    else:
-                        logger.warning(f"Image file not found at {abs_path}")
-                except Exception as e:
-                    logger.error(f"Error loading frame from path: {str(e)}")
-
-            # 4. If all else fails, generate a placeholder
-            if display_frame is None:
-                placeholder_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                cv2.putText(placeholder_frame, "Frame data unavailable", (50, 240), 
-                          cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-                cv2.putText(placeholder_frame, f"Score: {posture_score:.1f}", 
-                          (50, 280), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-                display_frame = placeholder_frame
+                pixmap = self._qt_converter.to_pixmap(display_frame)
+                scaled_pixmap = pixmap.scaled(
+                    size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                QPixmapCache.insert(cache_key, scaled_pixmap)
 
             # Update display
-            pixmap = cv_to_qt_pixmap(display_frame)
-            scaled_pixmap = pixmap.scaled(
-                self.video_frame.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             self.video_frame.setPixmap(scaled_pixmap)
 
         except Exception as e:
@@ -663,7 +1014,7 @@ class ReplayWidget(QWidget):
         Args:
             score: Posture score
             feedback: Feedback messages
-            joint_angles: Joint angle measurements
+            joint_angles: Quantized joint angle row (see _quantize_joint_angles)
         """
         # Update score
         self.score_value.setText(f"{score:.1f}")
@@ -683,17 +1034,26 @@ class ReplayWidget(QWidget):
         Update the joint angle display.
         
         Args:
-            joint_angles: Dictionary of joint angle measurements
+            joint_angles: int16 row of angles in hundredths of a degree,
+                ordered as JOINT_NAMES
         """
-        # Get ideal angles
-        ideal_angles = self.posture_analyzer.ideal_angles
+        # Build joint frames on first use
+        if not self._angle_frames_built:
+            self._build_angle_frames()
+        
+        # Dequantize and compare against the ideal angles in one pass
+        present = joint_angles != ANGLE_MISSING
+        current_angles = joint_angles * (1.0 / ANGLE_SCALE)
+        diffs = np.abs(current_angles - self._ideal_vec)
         
         # Update each joint frame
-        for joint, frame in self.angle_frames.items():
-            if joint in joint_angles:
-                current_angle = joint_angles[joint]
-                ideal_angle = ideal_angles.get(joint, 0)
-                diff = abs(current_angle - ideal_angle)
+        for i, joint in enumerate(JOINT_NAMES):
+            frame = self.angle_frames[joint]
+            
+            if present[i]:
+                current_angle = current_angles[i]
+                ideal_angle = self._ideal_vec[i]
+                diff = diffs[i]
                 
                 # Update values
                 frame.current_value.setText(f"{current_angle:.1f}°")
@@ -736,32 +1096,81 @@ class ReplayWidget(QWidget):
         self.is_playing = True
         self.play_pause_btn.setText("Pause")
 
+        # Playback decodes sequentially; scrub frames are no longer needed
+        self._clear_scrub_cache()
+
         # If we have a video file, use video playback thread
         if self.video_cap is not None and self.video_cap.isOpened():
             # Stop existing thread if running
             self._stop_video_thread()
 
-            # Start new thread
-            self.stop_video_thread = False
-            self.video_thread = threading.Thread(target=self._video_playback_loop)
+            # Start new threads with their own stop state, so threads from
+            # an earlier run that are still winding down cannot see it
+            sync = PlaybackSync()
+            self._playback_sync = sync
+            self.video_thread = threading.Thread(
+                target=self._video_playback_loop, args=(sync,))
             self.video_thread.daemon = True
+            self.pacing_thread = threading.Thread(
+                target=self._pacing_loop, args=(sync,))
+            self.pacing_thread.daemon = True
             self.video_thread.start()
+            self.pacing_thread.start()
+
+            # Poll at twice the frame rate so display and decode clocks
+            # drifting against each other do not drop frames
+            self.display_timer.start(max(1, int(500 / self.frame_rate)))
         else:
             # Use timer for frame-by-frame playback from images
-            self.last_frame_time = time.time()
-            self.playback_timer.start()
+            self._frames_played = 0
+            self._frame_clock.start()
+            self.playback_timer.start(int(1000 / self.frame_rate))
     
     def _stop_playback(self):
         """Stop playback."""
         self.is_playing = False
         self.play_pause_btn.setText("Play")
 
-        # Stop playback timer
+        # Stop playback timers
         self.playback_timer.stop()
+        self.display_timer.stop()
 
         # Stop video thread if running
         self._stop_video_thread()
     
+    def _on_playback_finished(self):
+        """Reset the play button once the video playback thread has finished."""
+        self.play_pause_btn.setText("Play")
+    
+    def _on_decode_error(self, message):
+        """
+        Replace the video capture after the playback thread hit a decode error.
+
+        Args:
+            message: Error message from the playback thread
+        """
+        # Make sure the faulted thread is gone before touching the capture
+        self._stop_playback()
+
+        if self.video_cap is not None:
+            with self._cap_lock:
+                self.video_cap.release()
+            self.video_cap = None
+
+        # Reopen with the same decode buffers; fall back to stored images
+        # if the video can no longer be opened
+        try:
+            if self.current_video_path:
+                self._open_video_capture()
+        except Exception as e:
+            logger.error(f"Error reopening video capture: {str(e)}")
+            self.video_cap = None
+
+        if self.session_data:
+            self._classify_frame_sources()
+
+        logger.info(f"Video capture reopened after playback error: {message}")
+    
     def _restart_playback(self):
         """Restart playback from the beginning."""
         if not self.session_data:
@@ -798,6 +1207,13 @@ class ReplayWidget(QWidget):
         
         # Show the next frame
         self._show_frame(next_frame)
+        
+        # Schedule the next tick against the playback clock so decode and
+        # display time does not accumulate as drift
+        self._frames_played += 1
+        frame_ms = 1000.0 / self.frame_rate
+        next_due = (self._frames_played + 1) * frame_ms
+        self.playback_timer.setInterval(max(0, int(next_due - self._frame_clock.elapsed())))
     
     def _slider_moved(self, value):
         """
@@ -806,7 +1222,7 @@ class ReplayWidget(QWidget):
         Args:
             value: New slider value (frame index)
         """
-        if not self.session_data:
+        if not self.session_data or self._syncing_slider:
             return
         
         # Stop playback
@@ -816,6 +1232,95 @@ class ReplayWidget(QWidget):
         # Show the specified frame
         self._show_frame(value)
     
+    def _start_scrub_prefetch(self):
+        """Start decoding a window of frames ahead of the slider for scrubbing."""
+        self._scrub_release_timer.stop()
+
+        if not self.session_data or self.video_cap is None or not self.current_video_path:
+            return
+
+        start_index = self.current_frame_index
+        end_index = min(start_index + SCRUB_PREFETCH_FRAMES, len(self.session_data))
+
+        # Reuse the cache while it (or the prefetch filling it) still covers
+        # at least half a window ahead of the slider
+        window = self._scrub_window
+        if (window is not None and window[0] <= start_index and
+                min(start_index + SCRUB_PREFETCH_FRAMES // 2, end_index) <= window[1]):
+            return
+
+        # A newer prefetch supersedes any still running
+        self._clear_scrub_cache()
+        self._scrub_window = (start_index, end_index)
+
+        prefetch_thread = threading.Thread(
+            target=self._prefetch_loop,
+            args=(self._prefetch_generation, self._scrub_cache, self.current_video_path,
+                  start_index, end_index)
+        )
+        prefetch_thread.daemon = True
+        prefetch_thread.start()
+
+    def _on_slider_released(self):
+        """Free the scrub cache shortly after scrubbing ends."""
+        self._scrub_release_timer.start()
+
+    def _clear_scrub_cache(self):
+        """Stop any running prefetch and drop the frames it decoded."""
+        self._scrub_release_timer.stop()
+        self._prefetch_generation += 1
+        self._scrub_cache = {}
+        self._scrub_window = None
+
+    def _prefetch_loop(self, generation, scrub_cache, video_path, start_index, end_index):
+        """
+        Decode frames ahead of the slider into the scrub cache.
+
+        Runs in a separate thread with its own VideoCapture so it never
+        touches the capture used for display. One seek is followed by
+        sequential reads, which is far cheaper than a seek per slider move.
+
+        Args:
+            generation: Prefetch generation this run belongs to
+            scrub_cache: Dictionary to fill with decoded frames
+            video_path: Path of the session video
+            start_index: First frame to decode
+            end_index: Frame after the last one to decode
+        """
+        cap = self._open_video_file(video_path)
+        try:
+            if not cap.isOpened():
+                logger.warning(f"Failed to open video file for prefetch: {video_path}")
+                return
+
+            # Backends may land near rather than on the target after a
+            # seek, so frames are keyed from where the stream really is
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_index)
+            frame_index = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+            while frame_index < end_index:
+                if generation != self._prefetch_generation:
+                    break
+
+                # Step over frames before the window without decoding them
+                if frame_index < start_index:
+                    if not cap.grab():
+                        break
+                    frame_index += 1
+                    continue
+
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                scrub_cache[frame_index] = frame
+                frame_index += 1
+
+        except Exception as e:
+            logger.error(f"Error prefetching frames for scrubbing: {str(e)}")
+        finally:
+            cap.release()
+
     def _toggle_keypoints(self, checked):
         """
         Toggle display of keypoints.
@@ -824,7 +1329,7 @@ class ReplayWidget(QWidget):
             checked: New checkbox state
         """
         self.show_keypoints = checked
-        self._show_frame(self.current_frame_index)
+        self._redraw_current_frame()
     
     def _toggle_angles(self, checked):
         """
@@ -834,7 +1339,7 @@ class ReplayWidget(QWidget):
             checked: New checkbox state
         """
         self.show_angles = checked
-        self._show_frame(self.current_frame_index)
+        self._redraw_current_frame()
     
     def _toggle_ideal_overlay(self, checked):
         """
@@ -844,71 +1349,233 @@ class ReplayWidget(QWidget):
             checked: New checkbox state
         """
         self.show_ideal_overlay = checked
+        self._redraw_current_frame()
+    
+    def _redraw_current_frame(self):
+        """Redraw the frame on screen after a display option changes."""
+        # Decoding here would move the stream under the playback thread,
+        # which tracks its position locally; the next frame it hands over
+        # is drawn with the new options anyway
+        if self.is_playing and self._playback_sync is not None:
+            return
+        
         self._show_frame(self.current_frame_index)
     
     
     def _stop_video_thread(self):
-        """Stop the video playback thread if running."""
-        if self.video_thread and self.video_thread.is_alive():
-            self.stop_video_thread = True
-            self.video_thread.join(timeout=1.0)
-            self.video_thread = None
-    
-    def _video_playback_loop(self):
-        """Video playback loop running in a separate thread."""
+        """
+        Ask the video playback and pacing threads to stop without waiting.
+
+        The threads exit on their own once they see the stop event; any
+        capture access they have left is serialized by _cap_lock, so the
+        GUI thread never blocks on a join.
+        """
+        sync = self._playback_sync
+        if sync is not None:
+            sync.stop.set()
+            # Wake the playback thread if it is waiting for a tick
+            sync.tick.set()
+            self._playback_sync = None
+
+        self.video_thread = None
+        self.pacing_thread = None
+
+        # Drop frames decoded ahead of the display
+        with self._queue_lock:
+            self._frame_queue.clear()
+    
+    def _pacing_loop(self, sync):
+        """
+        Pacing loop running in a separate thread.
+
+        Sleeps until each frame deadline, then publishes the number of the
+        frame that is due and wakes the playback thread. Keeping the sleep
+        here lets the playback thread start each frame on a fresh time slice.
+
+        Args:
+            sync: PlaybackSync shared with the playback thread of this run
+        """
+        frame_interval_ns = int(1_000_000_000 / self.frame_rate)
+
+        # Frame n is due at start_ns + n * frame_interval_ns
+        start_ns = time.monotonic_ns()
+        tick = 0
+        stop_evt = sync.stop
+
+        while not stop_evt.is_set() and self.is_playing:
+            tick += 1
+            deadline_ns = start_ns + tick * frame_interval_ns
+
+            # Sleep is only accurate to the OS timer resolution, so sleep
+            # short of the deadline and spin for the final stretch
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns > 2 * PACING_SPIN_NS:
+                # Returns early (True) as soon as a stop is requested
+                if stop_evt.wait((remaining_ns - PACING_SPIN_NS) / 1e9):
+                    break
+            while time.monotonic_ns() < deadline_ns:
+                pass
+
+            sync.ticks = tick
+            sync.tick.set()
+    
+    def _video_playback_loop(self, sync):
+        """
+        Video playback loop running in a separate thread.
+
+        Args:
+            sync: PlaybackSync shared with the pacing thread of this run
+        """
+        stop_evt = sync.stop
+        cap_lock = self._cap_lock
+
         try:
-            # Ensure video is at the current frame
-            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame_index)
+            with cap_lock:
+                if stop_evt.is_set():
+                    return
+                # Continue from the frame after the one on screen, tracking
+                # the stream position locally rather than querying the capture
+                pos = self._seek_video(self.current_frame_index + 1)
 
             # Calculate frame interval
             frame_interval = 1.0 / self.frame_rate
 
-            while not self.stop_video_thread and self.is_playing:
-                # Get the next frame
-                ret, frame = self.video_cap.read()
+            # Frames consumed so far; frame n is due once the pacing
+            # thread has published tick n
+            frame_count = 0
 
-                if not ret:
-                    # End of video, stop playback
-                    break
-                
-                # Get current frame index
-                current_pos = int(self.video_cap.get(cv2.CAP_PROP_POS_FRAMES)) - 1
+            # Rotate through the preallocated decode buffers
+            frame_pool = self._frame_pool
+            pool_size = len(frame_pool)
+            pool_slot = 0
+
+            # Bind loop invariants to locals; is_playing is re-read from
+            # self each iteration because the GUI thread changes it
+            session_len = len(self.session_data)
+            grab = self.video_cap.grab
+            retrieve = self.video_cap.retrieve
+            frame_queue = self._frame_queue
+            queue_lock = self._queue_lock
+            tick_event = sync.tick
+
+            while not stop_evt.is_set() and self.is_playing:
+                with cap_lock:
+                    # The GUI thread may have released the capture since
+                    if stop_evt.is_set():
+                        break
+
+                    # Skip (grab without decoding) every frame we are already late for
+                    skip = sync.ticks - frame_count
 
-                if current_pos >= len(self.session_data):
+                    if skip > SEEK_GRAB_LIMIT:
+                        # Far behind after a stall: one seek is bounded,
+                        # a grab per missed frame is not
+                        self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, pos + skip)
+                        pos = int(self.video_cap.get(cv2.CAP_PROP_POS_FRAMES))
+                        frame_count += skip
+                    elif skip > 0:
+                        for _ in range(skip):
+                            if stop_evt.is_set():
+                                break
+                            grab()
+                        frame_count += skip
+                        pos += skip
+
+                    if stop_evt.is_set():
+                        break
+
+                    # Decode only the frame that will be shown, into a pooled buffer
+                    ret = grab()
+                    if ret:
+                        if pool_size:
+                            ret, frame = retrieve(frame_pool[pool_slot])
+                            pool_slot = (pool_slot + 1) % pool_size
+                        else:
+                            ret, frame = retrieve()
+
+                    if not ret:
+                        # End of video, stop playback
+                        self._last_decoded_index = None
+                        break
+
+                    # Get current frame index
+                    current_pos = pos
+                    pos += 1
+                    self._last_decoded_index = current_pos
+
+                if current_pos >= session_len:
                     # We've reached the end of our data
                     break
                 
-                # Update the UI with the new frame
-                # We need to use signals/slots to update UI from a background thread
-                # For simplicity, we'll use the setValue signal from the slider
-                # This will trigger _slider_moved which updates the display
-                self.frame_slider.blockSignals(False)
-                self.frame_slider.setValue(current_pos)
-                self.frame_slider.blockSignals(True)
-
-                # Sleep to maintain frame rate
-                time.sleep(frame_interval)
-
-            # Stop playback when the thread exits
-            if self.is_playing:
-                self.is_playing = False
-                # Update UI in main thread
-                QTimer.singleShot(0, lambda: self.play_pause_btn.setText("Play"))
+                # Back off while the display is behind on draining frames
+                while (len(frame_queue) >= FRAME_QUEUE_SIZE and
+                       not stop_evt.is_set() and self.is_playing):
+                    stop_evt.wait(frame_interval / 4)
+
+                # Hand the frame to the GUI thread, which also moves the slider
+                with queue_lock:
+                    if stop_evt.is_set():
+                        break
+                    frame_queue.append((current_pos, frame))
+
+                # Wait for the pacing thread to signal the next frame
+                frame_count += 1
+                while (sync.ticks < frame_count and
+                       not stop_evt.is_set() and self.is_playing):
+                    tick_event.wait(frame_interval)
+                    tick_event.clear()
 
         except Exception as e:
-            logger.error(f"Error in video playback thread: {str(e)}")
-            self.is_playing = False
+            if not stop_evt.is_set():
+                logger.error(f"Error in video playback thread: {str(e)}")
+                # The capture may be in a bad state; let the GUI thread replace it
+                self._last_decoded_index = None
+                self.decode_error.emit(str(e))
+
+        finally:
+            # Stop playback when the thread exits on its own; after a stop
+            # request the GUI thread has already updated the state
+            if not stop_evt.is_set() and self.is_playing:
+                self.is_playing = False
+                # Update UI in main thread
+                self.playback_finished.emit()
 
+    def set_gpu_color_conversion(self, enabled):
+        """
+        Turn GPU colour conversion of large frames on or off.
+        
+        Args:
+            enabled: Whether large frames may be converted on the GPU
+        """
+        self._qt_converter.set_use_gpu(enabled)
+    
     def cleanup(self):
         """Clean up resources before widget is destroyed."""
-        # Stop playback timer
+        # Stop playback timers
         if hasattr(self, 'playback_timer'):
             self.playback_timer.stop()
+        if hasattr(self, 'display_timer'):
+            self.display_timer.stop()
 
         # Stop video thread
         self._stop_video_thread()
 
-        # Release video capture
+        # Stop any scrub prefetch and free its frames
+        self._clear_scrub_cache()
+
+        # Release video capture once a stopping playback thread is done with
+        # it; if the thread is stuck in the backend, leave the capture to be
+        # freed when the thread drops it rather than hold up closing
         if hasattr(self, 'video_cap') and self.video_cap is not None:
-            self.video_cap.release()
-            self.video_cap = None
\ No newline at end of file
+            if self._cap_lock.acquire(timeout=CAP_RELEASE_TIMEOUT_S):
+                try:
+                    self.video_cap.release()
+                finally:
+                    self._cap_lock.release()
+            else:
+                logger.warning("Playback thread still busy; not waiting to release video capture")
+            self.video_cap = None
+
+        # Shut down database worker pool
+        if hasattr(self, '_db_executor'):
+            self._db_executor.shutdown(wait=False)
\ No newline at end of file
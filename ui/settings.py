@@ -1,13 +1,17 @@
 import os
+import sys
+import time
+import shutil
 import logging
+import weakref
 import cv2
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
     QGroupBox, QFormLayout, QSlider, QTabWidget, QFileDialog,
-    QMessageBox, QRadioButton, QButtonGroup
+    QMessageBox, QRadioButton, QButtonGroup, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QSettings, QSize
+from PyQt6.QtCore import Qt, QSettings, QSize, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
 
 from utils.constants import (
@@ -16,18 +20,286 @@ from utils.constants import (
     POSTURE_SENSITIVITY
 )
 from utils.helpers import (
-    show_error_message, show_info_message, get_system_info
+    show_error_message, show_info_message, get_system_info, cuda_device_count,
+    camera_backend
 )
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Stored form of checkbox settings
+_BOOL = {True: 'true', False: 'false'}
+
+# Values written by "Reset to Defaults", serialized as stored in the database
+DEFAULTS = {
+    'theme': 'light',
+    'data_dir': DATA_DIR,
+    'reports_dir': REPORTS_DIR,
+    'camera_id': str(DEFAULT_CAMERA_ID),
+    'resolution': '640x480',
+    'fps': '30',
+    'detection_confidence': '0.5',
+    'analysis_delay': '1.0',
+    'posture_sensitivity': str(POSTURE_SENSITIVITY),
+    'show_angles': _BOOL[True],
+    'show_feedback': _BOOL[True],
+    'recording_fps': '15',
+    'recording_duration_limit': '300',  # 5 minutes
+    'auto_save': _BOOL[False],
+    'auto_analyze': _BOOL[True],
+    'keypoint_size': '3',
+    'connection_width': '2',
+    'ui_scale': '100',
+    'font_size': '10',
+    'gpu_color_conversion': _BOOL[False],
+}
+
+
+def _parse_bool(value):
+    """Decode a stored checkbox setting."""
+    return value.lower() == _BOOL[True]
+
+
+# Setting key -> decoder from the stored string to the value widgets use
+_SCHEMA = {
+    'theme': str,
+    'data_dir': str,
+    'reports_dir': str,
+    'camera_id': int,
+    'resolution': str,
+    'fps': int,
+    'detection_confidence': float,
+    'analysis_delay': float,
+    'posture_sensitivity': float,
+    'show_angles': _parse_bool,
+    'show_feedback': _parse_bool,
+    'recording_fps': int,
+    'recording_duration_limit': int,
+    'auto_save': _parse_bool,
+    'auto_analyze': _parse_bool,
+    'keypoint_size': int,
+    'connection_width': int,
+    'ui_scale': int,
+    'font_size': int,
+    'gpu_color_conversion': _parse_bool,
+}
+
+
+def decode_settings(raw):
+    """
+    Decode stored settings into native values, once, using _SCHEMA.
+    
+    Missing or malformed values fall back to DEFAULTS.
+    
+    Args:
+        raw: Dictionary of setting strings as stored in the database
+        
+    Returns:
+        Dictionary with a native value for every key in _SCHEMA
+    """
+    settings = {}
+    
+    for key, decode in _SCHEMA.items():
+        value = raw.get(key)
+        if value is not None:
+            try:
+                settings[key] = decode(value)
+                continue
+            except ValueError:
+                logger.warning(f"Ignoring invalid value for setting {key}: {value}")
+        settings[key] = decode(DEFAULTS[key])
+    
+    return settings
+
+
+# Bytes copied per sendfile() call during a database backup
+BACKUP_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Camera indices probed when scanning for devices
+CAMERA_SCAN_LIMIT = 5
+
+# How long the camera test waits for a result before reporting a timeout
+CAMERA_TEST_TIMEOUT_MS = 2000
+
+
+def cache_settings():
+    """
+    Get the QSettings store for values cached between launches.
+    
+    Returns:
+        QSettings instance
+    """
+    return QSettings(APP_NAME, "cache")
+
+
+class CameraScanThread(QThread):
+    """
+    Thread that probes camera indices without blocking the UI.
+    """
+    
+    # Emitted with the list of camera indices that opened
+    cameras_found = pyqtSignal(list)
+    
+    def run(self):
+        """Probe each camera index and report the ones that open."""
+        backend = camera_backend()
+        available = []
+        
+        for i in range(CAMERA_SCAN_LIMIT):
+            try:
+                cap = cv2.VideoCapture(i, backend)
+                if cap.isOpened():
+                    available.append(i)
+                cap.release()
+            except Exception as e:
+                logger.error(f"Error probing camera {i}: {str(e)}")
+        
+        self.cameras_found.emit(available)
+
+
+class CameraTestThread(QThread):
+    """
+    Thread that checks a camera can deliver a frame without blocking the UI.
+    """
+    
+    # Emitted with (success, status message)
+    result_ready = pyqtSignal(bool, str)
+    
+    def __init__(self, camera_id, parent=None):
+        """
+        Initialize the camera test thread.
+        
+        Args:
+            camera_id: ID of the camera to test
+            parent: Parent Qt object
+        """
+        super().__init__(parent)
+        self.camera_id = camera_id
+    
+    def run(self):
+        """Open the camera and grab one frame."""
+        try:
+            cap = cv2.VideoCapture(self.camera_id, camera_backend())
+            
+            if not cap.isOpened():
+                self.result_ready.emit(False, "Failed to open camera")
+                return
+            
+            # grab() is enough to prove frames arrive; skip decoding one
+            ret = cap.grab()
+            
+            # Release camera
+            cap.release()
+            
+            if ret:
+                self.result_ready.emit(True, "Working properly")
+            else:
+                self.result_ready.emit(False, "Failed to capture frame")
+            
+        except Exception as e:
+            logger.error(f"Error testing camera: {str(e)}")
+            self.result_ready.emit(False, f"Error - {str(e)}")
+
+
+class DatabaseBackupThread(QThread):
+    """
+    Thread that copies the database file without blocking the UI.
+    """
+    
+    # Emitted with the percentage copied so far
+    progress = pyqtSignal(int)
+    # Emitted with an error message if the copy fails
+    backup_failed = pyqtSignal(str)
+    
+    def __init__(self, db_path, backup_path, parent=None):
+        """
+        Initialize the backup thread.
+        
+        Args:
+            db_path: Path of the database file
+            backup_path: Destination path for the backup
+            parent: Parent Qt object
+        """
+        super().__init__(parent)
+        self.db_path = db_path
+        self.backup_path = backup_path
+    
+    def run(self):
+        """Copy the database file, then its timestamps and permissions."""
+        try:
+            if sys.platform.startswith('linux'):
+                self._copy_sendfile()
+            else:
+                shutil.copyfile(self.db_path, self.backup_path)
+            
+            shutil.copystat(self.db_path, self.backup_path)
+            self.progress.emit(100)
+            
+        except Exception as e:
+            logger.error(f"Error backing up database: {str(e)}")
+            self.backup_failed.emit(str(e))
+    
+    def _copy_sendfile(self):
+        """Copy in the kernel with sendfile(), reporting progress per chunk."""
+        with open(self.db_path, 'rb') as src, open(self.backup_path, 'wb') as dst:
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+            total = os.fstat(src_fd).st_size
+            offset = 0
+            
+            while offset < total:
+                sent = os.sendfile(dst_fd, src_fd, offset,
+                                   min(BACKUP_CHUNK_SIZE, total - offset))
+                if sent == 0:
+                    break
+                offset += sent
+                self.progress.emit(offset * 100 // total)
+
+
+class SystemInfoThread(QThread):
+    """
+    Thread that collects system information without blocking the UI.
+    """
+    
+    # Emitted with the fields of get_system_info() if collected, plus
+    # 'cuda_devices' if CUDA was probed
+    info_ready = pyqtSignal(dict)
+    
+    def __init__(self, probe_info, probe_cuda, parent=None):
+        """
+        Initialize the system information thread.
+        
+        Args:
+            probe_info: Whether to collect the get_system_info() fields
+            probe_cuda: Whether to count CUDA devices
+            parent: Parent Qt object
+        """
+        super().__init__(parent)
+        self.probe_info = probe_info
+        self.probe_cuda = probe_cuda
+    
+    def run(self):
+        """Collect system information and report it."""
+        try:
+            system_info = dict(get_system_info()) if self.probe_info else {}
+            if self.probe_cuda:
+                system_info['cuda_devices'] = cuda_device_count()
+            self.info_ready.emit(system_info)
+        except Exception as e:
+            logger.error(f"Error getting system info: {str(e)}")
+
 class SettingsWidget(QWidget):
     """
     Widget for application settings screen.
     Allows configuring application behavior and appearance.
     """
     
+    # Signal emitted with the decoded settings after they are saved or reset
+    settings_changed = pyqtSignal(dict)
+    
+    # Page title font, created on first use and shared by all instances
+    _TITLE_FONT = None
+    
     def __init__(self, data_manager):
         """
         Initialize the settings widget.
@@ -40,8 +312,37 @@ class SettingsWidget(QWidget):
         # Store data manager
         self.data_manager = data_manager
         
-        # Current settings
-        self.current_settings = {}
+        # Current settings, decoded to native values
+        self.current_settings = decode_settings({})
+        
+        # Tabs whose contents have been built
+        self._built_tabs = set()
+        
+        # (setting key, widget, kind) for every widget on the built tabs
+        self._bindings = []
+        
+        # Weak reference to the ancestor that applies the theme, once found
+        self._theme_host = None
+        
+        # Theme the main window is showing, to skip restyling when unchanged
+        self._applied_theme = None
+        
+        # Background camera scan, if one is running
+        self._camera_scan_thread = None
+        # Saved camera missing from the last list, selected once a scan finds it
+        self._pending_camera_id = None
+        
+        # Background database backup, if one is running
+        self._backup_thread = None
+        
+        # Background camera test, if one is running, and its deadline
+        self._camera_test_thread = None
+        self._camera_test_timer = QTimer(self)
+        self._camera_test_timer.setSingleShot(True)
+        self._camera_test_timer.timeout.connect(self._on_camera_test_timeout)
+        
+        # Background system information probe, if one is running
+        self._system_info_thread = None
         
         # Initialize UI
         self._init_ui()
@@ -49,6 +350,9 @@ class SettingsWidget(QWidget):
         # Load current settings
         self._load_settings()
         
+        # Build the tab shown first; the others are built when first selected
+        self._build_tab(self.tab_widget.currentIndex())
+        
         logger.info("SettingsWidget initialized")
     
     def _init_ui(self):
@@ -60,49 +364,32 @@ class SettingsWidget(QWidget):
         # Add title
         title_label = QLabel("Application Settings")
         title_label.setObjectName("page-title")
-        title_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        if SettingsWidget._TITLE_FONT is None:
+            SettingsWidget._TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+        title_label.setFont(SettingsWidget._TITLE_FONT)
         self.main_layout.addWidget(title_label)
         
         # Create tabs for different settings categories
         self.tab_widget = QTabWidget()
         self.main_layout.addWidget(self.tab_widget)
         
-        # General settings tab
-        self.general_tab = QWidget()
-        self._setup_general_tab()
-        self.tab_widget.addTab(self.general_tab, "General")
-        
-        # Camera settings tab
-        self.camera_tab = QWidget()
-        self._setup_camera_tab()
-        self.tab_widget.addTab(self.camera_tab, "Camera")
+        # Add empty placeholder tabs; each is filled in the first time it
+        # is selected, so the camera scan and system probe only run if needed
+        self.general_tab = self._add_lazy_tab("General", self._setup_general_tab)
+        self.camera_tab = self._add_lazy_tab("Camera", self._setup_camera_tab)
+        self.analysis_tab = self._add_lazy_tab("Analysis", self._setup_analysis_tab)
+        self.recording_tab = self._add_lazy_tab("Recording", self._setup_recording_tab)
+        self.display_tab = self._add_lazy_tab("Display", self._setup_display_tab)
+        self.system_tab = self._add_lazy_tab("System Info", self._setup_system_tab)
         
-        # Analysis settings tab
-        self.analysis_tab = QWidget()
-        self._setup_analysis_tab()
-        self.tab_widget.addTab(self.analysis_tab, "Analysis")
-        
-        # Recording settings tab
-        self.recording_tab = QWidget()
-        self._setup_recording_tab()
-        self.tab_widget.addTab(self.recording_tab, "Recording")
-        
-        # Display settings tab
-        self.display_tab = QWidget()
-        self._setup_display_tab()
-        self.tab_widget.addTab(self.display_tab, "Display")
-        
-        # System info tab
-        self.system_tab = QWidget()
-        self._setup_system_tab()
-        self.tab_widget.addTab(self.system_tab, "System Info")
+        self.tab_widget.currentChanged.connect(self._build_tab)
         
         # Add save and reset buttons
         buttons_layout = QHBoxLayout()
         
         self.save_btn = QPushButton("Save Settings")
         self.save_btn.setMinimumHeight(40)
-        self.save_btn.clicked.connect(self._save_settings)
+        self.save_btn.clicked.connect(self._on_save_clicked)
         buttons_layout.addWidget(self.save_btn)
         
         self.reset_btn = QPushButton("Reset to Defaults")
@@ -112,6 +399,41 @@ class SettingsWidget(QWidget):
         
         self.main_layout.addLayout(buttons_layout)
     
+    def _add_lazy_tab(self, title, setup_fn):
+        """
+        Add an empty tab that is populated on first show.
+        
+        Args:
+            title: Tab title
+            setup_fn: Method that builds the tab contents and adds its
+                widgets to self._bindings
+            
+        Returns:
+            Placeholder QWidget for the tab
+        """
+        tab = QWidget()
+        tab._setup_fn = setup_fn
+        self.tab_widget.addTab(tab, title)
+        return tab
+    
+    def _build_tab(self, index):
+        """
+        Build the tab at index if it has not been built yet.
+        
+        Args:
+            index: Tab index
+        """
+        tab = self.tab_widget.widget(index)
+        if tab is None or tab in self._built_tabs:
+            return
+        
+        first = len(self._bindings)
+        tab._setup_fn()
+        self._built_tabs.add(tab)
+        
+        # Fill in the widgets the tab has just bound
+        self._apply_bindings(self._bindings[first:])
+    
     def _setup_general_tab(self):
         """Set up the general settings tab."""
         layout = QVBoxLayout(self.general_tab)
@@ -151,6 +473,12 @@ class SettingsWidget(QWidget):
         
         form.addRow("Reports Directory:", reports_dir_layout)
         
+        self._bindings += [
+            ('theme', self.theme_combo, 'combo'),
+            ('data_dir', self.data_dir_edit, 'text'),
+            ('reports_dir', self.reports_dir_edit, 'text'),
+        ]
+        
         # Add form to layout
         layout.addLayout(form)
         
@@ -179,18 +507,22 @@ class SettingsWidget(QWidget):
         form = QFormLayout()
         
         # Camera device setting
+        camera_layout = QHBoxLayout()
+        
         self.camera_combo = QComboBox()
-        self.camera_combo.addItem("Default Camera", DEFAULT_CAMERA_ID)
+        self.camera_combo.activated.connect(self._on_camera_chosen)
+        camera_layout.addWidget(self.camera_combo, 1)
         
-        # Scan for available cameras (up to 5)
-        for i in range(5):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                cap.release()
-                if i != DEFAULT_CAMERA_ID:
-                    self.camera_combo.addItem(f"Camera {i}", i)
+        self.rescan_camera_btn = QPushButton("Rescan")
+        self.rescan_camera_btn.clicked.connect(self._scan_cameras)
+        camera_layout.addWidget(self.rescan_camera_btn)
+        
+        form.addRow("Camera Device:", camera_layout)
         
-        form.addRow("Camera Device:", self.camera_combo)
+        # Show the cameras found last time right away, then refresh the
+        # list in the background
+        self._populate_camera_combo(self._load_cached_cameras())
+        self._scan_cameras()
         
         # Resolution setting
         self.resolution_combo = QComboBox()
@@ -208,6 +540,12 @@ class SettingsWidget(QWidget):
         self.fps_spin.setValue(30)
         form.addRow("Frame Rate (FPS):", self.fps_spin)
         
+        self._bindings += [
+            ('camera_id', self.camera_combo, 'combo_int'),
+            ('resolution', self.resolution_combo, 'combo'),
+            ('fps', self.fps_spin, 'spin'),
+        ]
+        
         # Add form to layout
         layout.addLayout(form)
         
@@ -227,6 +565,92 @@ class SettingsWidget(QWidget):
         # Add spacer
         layout.addStretch()
     
+    def _load_cached_cameras(self):
+        """
+        Get the camera indices found by the last scan.
+        
+        Returns:
+            List of camera indices, empty if no scan has been cached
+        """
+        value = cache_settings().value("cameras/available", "")
+        try:
+            return [int(i) for i in str(value).split(",") if i]
+        except ValueError:
+            return []
+    
+    def _populate_camera_combo(self, cameras):
+        """
+        Fill the camera combo box, keeping the current selection.
+        
+        Args:
+            cameras: List of available camera indices
+        """
+        selected = self.camera_combo.currentData()
+        
+        if selected is None:
+            # First fill: start from the saved camera
+            selected = self.current_settings['camera_id']
+        elif self._pending_camera_id is not None:
+            # The saved camera was not listed before this scan
+            selected = self._pending_camera_id
+        
+        self.camera_combo.blockSignals(True)
+        self.camera_combo.clear()
+        self.camera_combo.addItem("Default Camera", DEFAULT_CAMERA_ID)
+        for i in cameras:
+            if i != DEFAULT_CAMERA_ID:
+                self.camera_combo.addItem(f"Camera {i}", i)
+        
+        index = self.camera_combo.findData(selected)
+        self._pending_camera_id = selected if index < 0 else None
+        self.camera_combo.setCurrentIndex(max(index, 0))
+        self.camera_combo.blockSignals(False)
+    
+    def _on_camera_chosen(self, index):
+        """
+        Keep the user's camera choice over a saved camera still pending.
+        
+        Args:
+            index: Index of the chosen combo box item
+        """
+        self._pending_camera_id = None
+    
+    def _scan_cameras(self):
+        """Start a background scan for available cameras."""
+        if self._camera_scan_thread is not None:
+            return
+        
+        self.rescan_camera_btn.setEnabled(False)
+        self.rescan_camera_btn.setText("Scanning...")
+        
+        self._camera_scan_thread = CameraScanThread(self)
+        self._camera_scan_thread.cameras_found.connect(self._on_cameras_found)
+        self._camera_scan_thread.finished.connect(self._on_camera_scan_finished)
+        self._camera_scan_thread.start()
+    
+    def _on_cameras_found(self, cameras):
+        """
+        Show and cache the result of a camera scan.
+        
+        Args:
+            cameras: List of available camera indices
+        """
+        self._populate_camera_combo(cameras)
+        
+        cache = cache_settings()
+        cache.setValue("cameras/available", ",".join(str(i) for i in cameras))
+        cache.setValue("cameras/scanned_at", time.time())
+        
+        logger.info(f"Found cameras: {cameras}")
+    
+    def _on_camera_scan_finished(self):
+        """Re-enable rescanning once the scan thread has exited."""
+        self._camera_scan_thread.deleteLater()
+        self._camera_scan_thread = None
+        
+        self.rescan_camera_btn.setEnabled(True)
+        self.rescan_camera_btn.setText("Rescan")
+    
     def _setup_analysis_tab(self):
         """Set up the analysis settings tab."""
         layout = QVBoxLayout(self.analysis_tab)
@@ -281,6 +705,14 @@ class SettingsWidget(QWidget):
         self.show_feedback_check.setChecked(True)
         feedback_layout.addWidget(self.show_feedback_check)
         
+        self._bindings += [
+            ('detection_confidence', self.detection_slider, 'tenths'),
+            ('analysis_delay', self.analysis_interval, 'double'),
+            ('posture_sensitivity', self.posture_sensitivity, 'double'),
+            ('show_angles', self.show_angles_check, 'check'),
+            ('show_feedback', self.show_feedback_check, 'check'),
+        ]
+        
         layout.addWidget(feedback_group)
         
         # Add spacer
@@ -325,6 +757,13 @@ class SettingsWidget(QWidget):
         self.auto_analyze_check.setChecked(True)
         options_layout.addWidget(self.auto_analyze_check)
         
+        self._bindings += [
+            ('recording_fps', self.recording_fps, 'spin'),
+            ('recording_duration_limit', self.recording_duration, 'spin'),
+            ('auto_save', self.auto_save_check, 'check'),
+            ('auto_analyze', self.auto_analyze_check, 'check'),
+        ]
+        
         layout.addWidget(options_group)
         
         # Add spacer
@@ -369,6 +808,14 @@ class SettingsWidget(QWidget):
         self.scale_group.addButton(self.scale_125, 125)
         self.scale_group.addButton(self.scale_150, 150)
         
+        # Scale percentage -> radio button, for restoring the saved scale
+        self._scale_map = {
+            75: self.scale_75,
+            100: self.scale_100,
+            125: self.scale_125,
+            150: self.scale_150,
+        }
+        
         self.scale_100.setChecked(True)
         
         scale_layout.addWidget(self.scale_75)
@@ -392,6 +839,26 @@ class SettingsWidget(QWidget):
         
         layout.addWidget(text_group)
         
+        # Create video display options
+        video_group = QGroupBox("Video Display")
+        video_layout = QVBoxLayout(video_group)
+        
+        self.gpu_convert_check = QCheckBox("Use GPU for Colour Conversion of HD Video")
+        self.gpu_convert_check.setToolTip(
+            "Converts frames of 1280x720 and larger on a CUDA device, if present. "
+            "Turn off if the GPU is busy with other work.")
+        video_layout.addWidget(self.gpu_convert_check)
+        
+        layout.addWidget(video_group)
+        
+        self._bindings += [
+            ('keypoint_size', self.keypoint_size, 'spin'),
+            ('connection_width', self.connection_width, 'spin'),
+            ('ui_scale', self.scale_group, 'scale'),
+            ('font_size', self.font_size, 'spin'),
+            ('gpu_color_conversion', self.gpu_convert_check, 'check'),
+        ]
+        
         # Add spacer
         layout.addStretch()
     
@@ -412,21 +879,38 @@ class SettingsWidget(QWidget):
         system_group = QGroupBox("System Information")
         system_layout = QFormLayout(system_group)
         
-        # Get system info
-        system_info = get_system_info()
+        # Value labels, filled in (and later refreshed) in place
+        self.system_layout = system_layout
+        self._sysinfo_labels = {
+            'os': QLabel("Loading..."),
+            'python': QLabel("Loading..."),
+            'opencv': QLabel("Loading..."),
+            'cuda': QLabel("Loading..."),
+        }
+        self.cuda_devices_label = None
+        
+        system_layout.addRow("Operating System:", self._sysinfo_labels['os'])
+        system_layout.addRow("Python Version:", self._sysinfo_labels['python'])
+        system_layout.addRow("OpenCV Version:", self._sysinfo_labels['opencv'])
+        system_layout.addRow("CUDA Support:", self._sysinfo_labels['cuda'])
         
-        system_layout.addRow("Operating System:", QLabel(f"{system_info['os']} {system_info['os_version']}"))
-        system_layout.addRow("Python Version:", QLabel(system_info['python_version'].split()[0]))
-        system_layout.addRow("OpenCV Version:", QLabel(system_info['opencv_version']))
+        layout.addWidget(system_group)
         
-        # CUDA availability
-        cuda_status = "Available" if system_info.get('cuda_available', False) else "Not Available"
-        system_layout.addRow("CUDA Support:", QLabel(cuda_status))
+        # Platform details do not change while the app runs, so show them
+        # straight away once they have been collected
+        probe_info = get_system_info.cache_info().currsize == 0
+        if not probe_info:
+            self._show_system_info(get_system_info())
         
-        if system_info.get('cuda_available', False):
-            system_layout.addRow("CUDA Devices:", QLabel(str(system_info.get('cuda_devices', 0))))
+        # Show the CUDA result saved by an earlier run; probing loads the
+        # CUDA runtime, so it only happens once or when refreshed
+        cuda_devices = cache_settings().value("system/cuda_devices")
+        if cuda_devices is not None:
+            self._show_cuda_devices(int(cuda_devices))
         
-        layout.addWidget(system_group)
+        # Collect whatever is still missing in the background
+        if probe_info or cuda_devices is None:
+            self._start_system_info_thread(probe_info, cuda_devices is None)
         
         # Add directory info
         dir_group = QGroupBox("Directory Information")
@@ -451,11 +935,78 @@ class SettingsWidget(QWidget):
         # Add spacer
         layout.addStretch()
     
+    def _start_system_info_thread(self, probe_info, probe_cuda):
+        """
+        Collect system information in the background.
+        
+        Args:
+            probe_info: Whether to collect the get_system_info() fields
+            probe_cuda: Whether to count CUDA devices
+        """
+        self._system_info_thread = SystemInfoThread(probe_info, probe_cuda, self)
+        self._system_info_thread.info_ready.connect(self._on_system_info_ready)
+        self._system_info_thread.finished.connect(self._on_system_info_finished)
+        self._system_info_thread.start()
+    
+    def _on_system_info_ready(self, system_info):
+        """
+        Show collected system information in the system tab.
+        
+        Args:
+            system_info: Dictionary from SystemInfoThread
+        """
+        if 'os' in system_info:
+            self._show_system_info(system_info)
+        
+        if 'cuda_devices' in system_info:
+            cuda_devices = system_info['cuda_devices']
+            cache_settings().setValue("system/cuda_devices", cuda_devices)
+            self._show_cuda_devices(cuda_devices)
+    
+    def _show_system_info(self, system_info):
+        """
+        Show platform details in the system tab.
+        
+        Args:
+            system_info: Mapping returned by get_system_info()
+        """
+        labels = self._sysinfo_labels
+        labels['os'].setText(f"{system_info['os']} {system_info['os_version']}")
+        labels['python'].setText(system_info['python_version'].split()[0])
+        labels['opencv'].setText(system_info['opencv_version'])
+    
+    def _show_cuda_devices(self, cuda_devices):
+        """
+        Show CUDA availability in the system tab.
+        
+        Args:
+            cuda_devices: Number of CUDA-enabled devices
+        """
+        cuda_status = "Available" if cuda_devices > 0 else "Not Available"
+        self._sysinfo_labels['cuda'].setText(cuda_status)
+        
+        # The devices row is only added once a device has been seen
+        if cuda_devices > 0 and self.cuda_devices_label is None:
+            self.cuda_devices_label = QLabel()
+            self.system_layout.addRow("CUDA Devices:", self.cuda_devices_label)
+        if self.cuda_devices_label is not None:
+            self.cuda_devices_label.setText(str(cuda_devices))
+    
+    def _on_system_info_finished(self):
+        """Release a system information thread once it has exited."""
+        thread = self.sender()
+        if thread is self._system_info_thread:
+            self._system_info_thread = None
+        thread.deleteLater()
+    
     def _load_settings(self):
         """Load current settings from database."""
         try:
             # Get all app settings
-            self.current_settings = self.data_manager.get_app_settings()
+            self.current_settings = decode_settings(self.data_manager.get_app_settings())
+            
+            # The main window applied the stored theme at startup
+            self._applied_theme = self.current_settings['theme']
             
             # Update UI with loaded settings
             self._update_ui_from_settings()
@@ -468,115 +1019,91 @@ class SettingsWidget(QWidget):
                               f"Failed to load settings: {str(e)}")
     
     def _update_ui_from_settings(self):
-        """Update UI components with loaded settings."""
-        # General tab
-        theme = self.current_settings.get('theme', 'light')
-        index = self.theme_combo.findData(theme)
-        if index >= 0:
-            self.theme_combo.setCurrentIndex(index)
-        
-        data_dir = self.current_settings.get('data_dir', DATA_DIR)
-        self.data_dir_edit.setText(data_dir)
-        
-        reports_dir = self.current_settings.get('reports_dir', REPORTS_DIR)
-        self.reports_dir_edit.setText(reports_dir)
-        
-        # Camera tab
-        camera_id = int(self.current_settings.get('camera_id', DEFAULT_CAMERA_ID))
-        index = self.camera_combo.findData(camera_id)
-        if index >= 0:
-            self.camera_combo.setCurrentIndex(index)
-        
-        resolution = self.current_settings.get('resolution', '640x480')
-        index = self.resolution_combo.findData(resolution)
-        if index >= 0:
-            self.resolution_combo.setCurrentIndex(index)
-        
-        fps = int(self.current_settings.get('fps', '30'))
-        self.fps_spin.setValue(fps)
-        
-        # Analysis tab
-        detection_confidence = float(self.current_settings.get('detection_confidence', '0.5'))
-        slider_value = int(detection_confidence * 10)
-        self.detection_slider.setValue(slider_value)
-        
-        analysis_interval = float(self.current_settings.get('analysis_delay', '1.0'))
-        self.analysis_interval.setValue(analysis_interval)
-        
-        posture_sensitivity = float(self.current_settings.get('posture_sensitivity', str(POSTURE_SENSITIVITY)))
-        self.posture_sensitivity.setValue(posture_sensitivity)
-        
-        show_angles = self.current_settings.get('show_angles', 'true').lower() == 'true'
-        self.show_angles_check.setChecked(show_angles)
-        
-        show_feedback = self.current_settings.get('show_feedback', 'true').lower() == 'true'
-        self.show_feedback_check.setChecked(show_feedback)
-        
-        # Recording tab
-        recording_fps = int(self.current_settings.get('recording_fps', '15'))
-        self.recording_fps.setValue(recording_fps)
-        
-        recording_duration = int(self.current_settings.get('recording_duration_limit', '300'))
-        self.recording_duration.setValue(recording_duration)
-        
-        auto_save = self.current_settings.get('auto_save', 'false').lower() == 'true'
-        self.auto_save_check.setChecked(auto_save)
-        
-        auto_analyze = self.current_settings.get('auto_analyze', 'true').lower() == 'true'
-        self.auto_analyze_check.setChecked(auto_analyze)
-        
-        # Display tab
-        keypoint_size = int(self.current_settings.get('keypoint_size', '3'))
-        self.keypoint_size.setValue(keypoint_size)
+        """Update the components of every built tab with loaded settings."""
+        self._apply_bindings(self._bindings)
+    
+    def _apply_bindings(self, bindings):
+        """
+        Set bound widgets from current_settings.
         
-        connection_width = int(self.current_settings.get('connection_width', '2'))
-        self.connection_width.setValue(connection_width)
+        Args:
+            bindings: (setting key, widget, kind) entries to update
+        """
+        for key, widget, kind in bindings:
+            self._set_widget(widget, kind, self.current_settings[key])
+    
+    def _set_widget(self, widget, kind, value):
+        """
+        Show a stored setting value in a widget.
         
-        ui_scale = int(self.current_settings.get('ui_scale', '100'))
-        for button in self.scale_group.buttons():
-            if self.scale_group.id(button) == ui_scale:
-                button.setChecked(True)
-                break
+        Args:
+            widget: Bound widget
+            kind: Binding kind, see _bindings
+            value: Setting value as decoded by decode_settings()
+        """
+        if kind == 'combo' or kind == 'combo_int':
+            index = widget.findData(value)
+            if index >= 0:
+                widget.setCurrentIndex(index)
+        elif kind == 'text':
+            widget.setText(value)
+        elif kind == 'spin' or kind == 'double':
+            widget.setValue(value)
+        elif kind == 'tenths':
+            widget.setValue(int(value * 10))
+        elif kind == 'check':
+            widget.setChecked(value)
+        elif kind == 'scale':
+            self._scale_map.get(value, self.scale_100).setChecked(True)
+    
+    def _get_widget(self, widget, kind):
+        """
+        Read a widget's value in the form stored in the database.
         
-        font_size = int(self.current_settings.get('font_size', '10'))
-        self.font_size.setValue(font_size)
+        Args:
+            widget: Bound widget
+            kind: Binding kind, see _bindings
+            
+        Returns:
+            Setting value as a string
+        """
+        if kind == 'combo':
+            return widget.currentData()
+        if kind == 'combo_int':
+            return str(widget.currentData())
+        if kind == 'text':
+            return widget.text()
+        if kind == 'spin' or kind == 'double':
+            return str(widget.value())
+        if kind == 'tenths':
+            return str(widget.value() / 10.0)
+        if kind == 'check':
+            return _BOOL[widget.isChecked()]
+        if kind == 'scale':
+            return str(widget.checkedId())
+        raise ValueError(f"Unknown setting widget kind: {kind}")
+    
+    def _on_save_clicked(self):
+        """Start a save, ignoring further clicks until it has finished."""
+        self.save_btn.setEnabled(False)
+        QTimer.singleShot(0, self._save_settings)
     
     def _save_settings(self):
         """Save settings to database."""
         try:
-            # General tab
-            self.data_manager.set_app_setting('theme', self.theme_combo.currentData())
-            self.data_manager.set_app_setting('data_dir', self.data_dir_edit.text())
-            self.data_manager.set_app_setting('reports_dir', self.reports_dir_edit.text())
-            
-            # Camera tab
-            self.data_manager.set_app_setting('camera_id', str(self.camera_combo.currentData()))
-            self.data_manager.set_app_setting('resolution', self.resolution_combo.currentData())
-            self.data_manager.set_app_setting('fps', str(self.fps_spin.value()))
-            
-            # Analysis tab
-            detection_confidence = self.detection_slider.value() / 10.0
-            self.data_manager.set_app_setting('detection_confidence', str(detection_confidence))
-            
-            self.data_manager.set_app_setting('analysis_delay', str(self.analysis_interval.value()))
-            self.data_manager.set_app_setting('posture_sensitivity', str(self.posture_sensitivity.value()))
-            self.data_manager.set_app_setting('show_angles', 'true' if self.show_angles_check.isChecked() else 'false')
-            self.data_manager.set_app_setting('show_feedback', 'true' if self.show_feedback_check.isChecked() else 'false')
+            # Tabs that were never shown still hold the stored values and
+            # have no bindings, so only the built ones are written
+            settings = {key: self._get_widget(widget, kind)
+                        for key, widget, kind in self._bindings}
             
-            # Recording tab
-            self.data_manager.set_app_setting('recording_fps', str(self.recording_fps.value()))
-            self.data_manager.set_app_setting('recording_duration_limit', str(self.recording_duration.value()))
-            self.data_manager.set_app_setting('auto_save', 'true' if self.auto_save_check.isChecked() else 'false')
-            self.data_manager.set_app_setting('auto_analyze', 'true' if self.auto_analyze_check.isChecked() else 'false')
+            # Write everything in one transaction
+            self.data_manager.set_app_settings(settings)
             
-            # Display tab
-            self.data_manager.set_app_setting('keypoint_size', str(self.keypoint_size.value()))
-            self.data_manager.set_app_setting('connection_width', str(self.connection_width.value()))
-            
-            ui_scale = self.scale_group.checkedId()
-            self.data_manager.set_app_setting('ui_scale', str(ui_scale))
-            
-            self.data_manager.set_app_setting('font_size', str(self.font_size.value()))
+            # The widgets already show what was saved, so only the cached
+            # values are brought up to date; the UI is not re-read
+            self.current_settings.update(
+                {key: _SCHEMA[key](value) for key, value in settings.items()})
+            self.settings_changed.emit(dict(self.current_settings))
             
             # Show success message
             show_info_message(self, "Settings Saved", 
@@ -586,17 +1113,54 @@ class SettingsWidget(QWidget):
             logger.info("Settings saved successfully")
             
             # Apply theme immediately if possible
-            parent = self.parent()
-            while parent and not hasattr(parent, '_apply_theme'):
-                parent = parent.parent()
-            
-            if parent and hasattr(parent, '_apply_theme'):
-                parent._apply_theme()
+            self._apply_window_theme(settings.get('theme', self._applied_theme))
             
         except Exception as e:
             logger.error(f"Error saving settings: {str(e)}")
             show_error_message(self, "Settings Error", 
                               f"Failed to save settings: {str(e)}")
+        
+        finally:
+            self.save_btn.setEnabled(True)
+    
+    def _find_theme_host(self):
+        """
+        Find the ancestor widget that applies the theme, caching the result.
+        
+        Returns:
+            Widget with an _apply_theme method, or None if there is none
+        """
+        parent = self.parent()
+        while parent and not hasattr(parent, '_apply_theme'):
+            parent = parent.parent()
+        
+        if parent is None:
+            return None
+        
+        # Weak so the settings page never keeps the main window alive
+        self._theme_host = weakref.ref(parent)
+        return parent
+    
+    def _apply_window_theme(self, theme):
+        """
+        Re-apply the saved theme through the main window, if found.
+        
+        Restyling touches every widget, so nothing is done if the theme
+        is the one already showing.
+        
+        Args:
+            theme: Theme that was just saved
+        """
+        if theme == self._applied_theme:
+            return
+        
+        host = self._theme_host() if self._theme_host else None
+        if host is None:
+            host = self._find_theme_host()
+        
+        if host is not None:
+            host._apply_theme()
+            self._applied_theme = theme
     
     def _reset_settings(self):
         """Reset settings to defaults."""
@@ -614,42 +1178,16 @@ class SettingsWidget(QWidget):
             return
         
         try:
-            # Reset to default values
+            # Write the known defaults directly rather than round-tripping
+            # them through the widgets
+            self.data_manager.set_app_settings(DEFAULTS)
+            self.current_settings = decode_settings(DEFAULTS)
+            self.settings_changed.emit(dict(self.current_settings))
             
-            # General tab
-            self.theme_combo.setCurrentIndex(0)  # Light theme
-            self.data_dir_edit.setText(DATA_DIR)
-            self.reports_dir_edit.setText(REPORTS_DIR)
-            
-            # Camera tab
-            index = self.camera_combo.findData(DEFAULT_CAMERA_ID)
-            if index >= 0:
-                self.camera_combo.setCurrentIndex(index)
-            
-            self.resolution_combo.setCurrentIndex(0)  # 640x480
-            self.fps_spin.setValue(30)
-            
-            # Analysis tab
-            self.detection_slider.setValue(5)  # 0.5
-            self.analysis_interval.setValue(1.0)
-            self.posture_sensitivity.setValue(POSTURE_SENSITIVITY)
-            self.show_angles_check.setChecked(True)
-            self.show_feedback_check.setChecked(True)
-            
-            # Recording tab
-            self.recording_fps.setValue(15)
-            self.recording_duration.setValue(300)  # 5 minutes
-            self.auto_save_check.setChecked(False)
-            self.auto_analyze_check.setChecked(True)
-            
-            # Display tab
-            self.keypoint_size.setValue(3)
-            self.connection_width.setValue(2)
-            self.scale_100.setChecked(True)
-            self.font_size.setValue(10)
+            # Tabs not built yet pick the defaults up when first shown
+            self._update_ui_from_settings()
             
-            # Save reset settings
-            self._save_settings()
+            self._apply_window_theme(DEFAULTS['theme'])
             
             show_info_message(self, "Settings Reset", 
                              "Settings have been reset to defaults.")
@@ -700,15 +1238,22 @@ class SettingsWidget(QWidget):
             
             # Count files to delete
             file_count = 0
+            errors = []
             
-            for filename in os.listdir(TEMP_DIR):
-                file_path = os.path.join(TEMP_DIR, filename)
-                if os.path.isfile(file_path):
-                    try:
-                        os.remove(file_path)
-                        file_count += 1
-                    except Exception as e:
-                        logger.error(f"Error deleting file {file_path}: {str(e)}")
+            # scandir reports each entry's type with the listing, so no
+            # extra stat call is needed per file
+            with os.scandir(TEMP_DIR) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        try:
+                            os.unlink(entry.path)
+                            file_count += 1
+                        except OSError as e:
+                            errors.append(f"{entry.name}: {str(e)}")
+            
+            if errors:
+                logger.error(f"Failed to delete {len(errors)} temporary files: "
+                             f"{'; '.join(errors)}")
             
             # Show success message
             show_info_message(self, "Temp Files Cleared", 
@@ -723,86 +1268,137 @@ class SettingsWidget(QWidget):
     
     def _backup_database(self):
         """Create a backup of the database."""
-        try:
-            # Choose backup location
-            backup_path, _ = QFileDialog.getSaveFileName(
-                self, "Save Database Backup", 
-                os.path.join(DATA_DIR, "shooting_analyzer_backup.db"),
-                "SQLite Database (*.db)"
-            )
-            
-            if not backup_path:
-                return
-            
-            # Get database path
-            db_path = self.data_manager.db_path
-            
-            # Copy database file
-            import shutil
-            shutil.copy2(db_path, backup_path)
-            
-            # Show success message
-            show_info_message(self, "Backup Created", 
-                             f"Database backup created successfully at:\n{backup_path}")
-            
-            logger.info(f"Database backed up to {backup_path}")
-            
-        except Exception as e:
-            logger.error(f"Error backing up database: {str(e)}")
+        # Choose backup location
+        backup_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Database Backup", 
+            os.path.join(DATA_DIR, "shooting_analyzer_backup.db"),
+            "SQLite Database (*.db)"
+        )
+        
+        if not backup_path:
+            return
+        
+        # Copy database file in the background; large databases would
+        # otherwise freeze the UI for the duration of the copy
+        progress_dialog = QProgressDialog("Backing up database...", None, 0, 100, self)
+        progress_dialog.setWindowTitle("Backup Database")
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+        
+        thread = DatabaseBackupThread(self.data_manager.db_path, backup_path, self)
+        self._backup_thread = thread
+        failures = []
+        thread.progress.connect(progress_dialog.setValue)
+        thread.backup_failed.connect(failures.append)
+        thread.finished.connect(
+            lambda: self._on_backup_finished(thread, progress_dialog, backup_path, failures))
+        
+        self.backup_db_btn.setEnabled(False)
+        thread.start()
+    
+    def _on_backup_finished(self, thread, progress_dialog, backup_path, failures):
+        """
+        Report the outcome of a database backup.
+        
+        Args:
+            thread: Finished DatabaseBackupThread
+            progress_dialog: Progress dialog shown during the copy
+            backup_path: Destination path of the backup
+            failures: Error messages reported by the thread
+        """
+        progress_dialog.close()
+        thread.deleteLater()
+        self._backup_thread = None
+        self.backup_db_btn.setEnabled(True)
+        
+        if failures:
             show_error_message(self, "Backup Error", 
-                              f"Failed to create database backup: {str(e)}")
+                              f"Failed to create database backup: {failures[0]}")
+            return
+        
+        # Show success message
+        show_info_message(self, "Backup Created", 
+                         f"Database backup created successfully at:\n{backup_path}")
+        
+        logger.info(f"Database backed up to {backup_path}")
     
     def _test_camera(self):
         """Test the selected camera."""
-        try:
-            # Get selected camera ID
-            camera_id = self.camera_combo.currentData()
-            
-            # Open camera
-            cap = cv2.VideoCapture(camera_id)
-            
-            if not cap.isOpened():
-                self.camera_status.setText("Camera status: Failed to open camera")
-                self.camera_status.setStyleSheet("color: red;")
-                return
-            
-            # Try to read a frame
-            ret, frame = cap.read()
-            
-            # Release camera
-            cap.release()
-            
-            if ret:
-                self.camera_status.setText("Camera status: Working properly")
-                self.camera_status.setStyleSheet("color: green;")
-            else:
-                self.camera_status.setText("Camera status: Failed to capture frame")
-                self.camera_status.setStyleSheet("color: red;")
-            
-        except Exception as e:
-            logger.error(f"Error testing camera: {str(e)}")
-            self.camera_status.setText(f"Camera status: Error - {str(e)}")
-            self.camera_status.setStyleSheet("color: red;")
+        if self._camera_test_thread is not None:
+            return
+        
+        # Get selected camera ID
+        camera_id = self.camera_combo.currentData()
+        
+        self.test_camera_btn.setEnabled(False)
+        self.camera_status.setText("Camera status: Testing...")
+        self.camera_status.setStyleSheet("")
+        
+        # Opening a missing device can block for seconds on some backends
+        self._camera_test_thread = CameraTestThread(camera_id, self)
+        self._camera_test_thread.result_ready.connect(self._on_camera_test_result)
+        self._camera_test_thread.finished.connect(self._on_camera_test_finished)
+        self._camera_test_thread.start()
+        
+        self._camera_test_timer.start(CAMERA_TEST_TIMEOUT_MS)
+    
+    def _on_camera_test_result(self, success, message):
+        """
+        Show the outcome of a camera test.
+        
+        Args:
+            success: True if the camera delivered a frame
+            message: Status message
+        """
+        self._camera_test_timer.stop()
+        self.camera_status.setText(f"Camera status: {message}")
+        self.camera_status.setStyleSheet("color: green;" if success else "color: red;")
+    
+    def _on_camera_test_timeout(self):
+        """Report a camera test that is still waiting on the device."""
+        self.camera_status.setText("Camera status: No response from camera")
+        self.camera_status.setStyleSheet("color: red;")
+    
+    def _on_camera_test_finished(self):
+        """Allow another test once the test thread has exited."""
+        self._camera_test_timer.stop()
+        self._camera_test_thread.deleteLater()
+        self._camera_test_thread = None
+        self.test_camera_btn.setEnabled(True)
     
     def _refresh_system_info(self):
         """Refresh system information display."""
+        # Only one probe at a time; a running one reports back shortly
+        if self._system_info_thread is not None:
+            return
+        
         try:
-            # Re-create system tab
-            old_tab = self.system_tab
+            # Probe CUDA again rather than showing the cached result; the
+            # cached platform details cannot change while the app runs
+            cuda_device_count.cache_clear()
+            cache_settings().remove("system/cuda_devices")
             
-            self.system_tab = QWidget()
-            self._setup_system_tab()
-            
-            index = self.tab_widget.indexOf(old_tab)
-            self.tab_widget.removeTab(index)
-            self.tab_widget.insertTab(index, self.system_tab, "System Info")
-            self.tab_widget.setCurrentIndex(index)
-            
-            # Show success message
-            show_info_message(self, "System Info Refreshed", 
-                             "System information has been refreshed.")
+            # Update the existing labels in place when the probe reports back
+            self._sysinfo_labels['cuda'].setText("Loading...")
+            self._start_system_info_thread(False, True)
             
         except Exception as e:
             logger.error(f"Error refreshing system info: {str(e)}")
             show_error_message(self, "Refresh Error", 
-                              f"Failed to refresh system information: {str(e)}")
\ No newline at end of file
+                              f"Failed to refresh system information: {str(e)}")
+    
+    def cleanup(self):
+        """Clean up resources before widget is destroyed."""
+        # Probes can block for several seconds (loading the CUDA runtime,
+        # opening a stuck camera), and destroying a running QThread
+        # aborts, so wait for them to finish
+        if self._system_info_thread is not None:
+            self._system_info_thread.wait()
+        if self._camera_scan_thread is not None:
+            self._camera_scan_thread.wait()
+        if self._camera_test_thread is not None:
+            self._camera_test_thread.wait()
+        
+        # A backup must run to completion or the copy is left truncated
+        if self._backup_thread is not None:
+            self._backup_thread.wait()
@@ -1,4 +1,5 @@
 import os
+import re
 import pathlib
 
 # Application information
@@ -8,15 +9,19 @@ APP_VERSION = "1.0.0"
 # Logging format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-# Application directories
-APP_DIR = os.path.join(os.path.expanduser("~"), ".shooting_analyzer")
-DATA_DIR = os.path.join(APP_DIR, "data")
-TEMP_DIR = os.path.join(APP_DIR, "temp")
-REPORTS_DIR = os.path.join(APP_DIR, "reports")
-LOG_DIR = os.path.join(APP_DIR, "logs")
+# Home directory, resolved once (expanduser may look up the user database)
+_HOME = pathlib.Path.home()
+
+# Application directories, as a Path and as plain strings for os and Qt calls
+APP_DIR_PATH = _HOME / ".shooting_analyzer"
+APP_DIR = os.fspath(APP_DIR_PATH)
+DATA_DIR = os.fspath(APP_DIR_PATH / "data")
+TEMP_DIR = os.fspath(APP_DIR_PATH / "temp")
+REPORTS_DIR = os.fspath(APP_DIR_PATH / "reports")
+LOG_DIR = os.fspath(APP_DIR_PATH / "logs")
 
 # Database path
-DATABASE_PATH = os.path.join(DATA_DIR, "shooting_analyzer.db")
+DATABASE_PATH = os.fspath(APP_DIR_PATH / "data" / "shooting_analyzer.db")
 
 # UI constants
 UI_TITLE = "Rifle Shooting Posture Analyzer"
@@ -30,6 +35,7 @@ VIDEO_HEIGHT = 480
 VIDEO_FPS = 30
 RECORDING_FPS = 15
 MAX_RECORDING_SECONDS = 300  # 5 minutes
+PIXMAP_CACHE_LIMIT_KB = 131072  # 128 MB for QPixmapCache
 
 # Analysis constants
 ANALYSIS_INTERVAL = 1.0  # seconds between analyses
@@ -175,4 +181,13 @@ STYLESHEET_DARK = """
         subcontrol-position: top center;
         padding: 0 3px;
     }
-"""
\ No newline at end of file
+"""
+
+def _minify_stylesheet(stylesheet):
+    """Collapse whitespace in a stylesheet so Qt's parser has less to scan."""
+    stylesheet = re.sub(r'\s+', ' ', stylesheet)
+    return re.sub(r' ?([{};]) ?', r'\1', stylesheet).strip()
+
+# Minified stylesheets, computed once at import, for setStyleSheet()
+STYLESHEET_LIGHT_MIN = _minify_stylesheet(STYLESHEET_LIGHT)
+STYLESHEET_DARK_MIN = _minify_stylesheet(STYLESHEET_DARK)
@@ -1,8 +1,13 @@
 import os
+import sys
+import bisect
+import platform
 import cv2
 import numpy as np
 import logging
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional, Union, Any
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QImage, QPixmap, QIcon
@@ -16,39 +21,73 @@ from utils.constants import (
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Score thresholds and the colour for each band between them:
+# poor (red), fair (orange), good (blue), excellent (green)
+_SCORE_CUTS = (50, 70, 85)
+_SCORE_COLORS = (COLORS['danger'], COLORS['warning'], COLORS['primary'], COLORS['secondary'])
+
+# File extensions (lowercase, without dot) accepted as images and videos
+_IMAGE_EXTS = frozenset(('jpg', 'jpeg', 'png', 'bmp', 'gif'))
+_VIDEO_EXTS = frozenset(('mp4', 'avi', 'mov', 'wmv', 'mkv'))
+
+# Set once ensure_app_directories() has run in this process
+_DIRS_ENSURED = False
+
 def ensure_app_directories():
     """Create application directories if they don't exist."""
+    global _DIRS_ENSURED
+    if _DIRS_ENSURED:
+        return
+    
     dirs_to_create = [APP_DIR, DATA_DIR, TEMP_DIR, REPORTS_DIR, LOG_DIR]
     
     for directory in dirs_to_create:
-        if not os.path.exists(directory):
+        # One mkdir attempt instead of a stat followed by mkdir
+        try:
             os.makedirs(directory)
             logger.info(f"Created directory: {directory}")
+        except FileExistsError:
+            pass
+    
+    _DIRS_ENSURED = True
 
 def cv_to_qt_image(cv_img):
     """
     Convert OpenCV image to QImage.
     
+    The QImage wraps the array's memory without copying; the array is
+    attached to the image so it stays alive as long as the image does.
+    
     Args:
         cv_img: OpenCV image (numpy array)
         
     Returns:
         QImage object
     """
-    # Convert to RGB if needed
-    if len(cv_img.shape) == 3:
-        cv_img = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
+    # Qt needs each row's pixels packed together; slices and views with
+    # a column step are copied once here rather than misread
+    if not cv_img.flags['C_CONTIGUOUS']:
+        cv_img = np.ascontiguousarray(cv_img)
     
     height, width = cv_img.shape[:2]
+    bytes_per_line = cv_img.strides[0]
     
-    # Get correct format based on image channels
-    if len(cv_img.shape) == 3:
-        bytes_per_line = width * 3
-        q_img = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
+    # Get correct format based on image channels; Qt reads OpenCV's BGR
+    # order directly, so no colour conversion pass is needed
+    if len(cv_img.shape) == 3 and cv_img.shape[2] == 4:
+        # ARGB32 is stored as BGRA bytes on little-endian machines
+        q_img = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format.Format_ARGB32)
+    elif len(cv_img.shape) == 3:
+        q_img = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format.Format_BGR888)
+    elif cv_img.dtype == np.uint16:
+        # 16-bit depth/IR frames are shown at full precision instead of
+        # being scaled down to 8 bits first
+        q_img = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale16)
     else:
-        bytes_per_line = width
         q_img = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale8)
     
+    q_img.ndarray_ref = cv_img
+    
     return q_img
 
 def cv_to_qt_pixmap(cv_img):
@@ -62,12 +101,134 @@ def cv_to_qt_pixmap(cv_img):
         QPixmap object
     """
     q_img = cv_to_qt_image(cv_img)
-    return QPixmap.fromImage(q_img)
+    # The image is already BGR888, ARGB32, Grayscale8 or Grayscale16,
+    # which paint as-is; skip Qt's dithering conversion to the screen format
+    return QPixmap.fromImage(q_img, Qt.ImageConversionFlag.NoFormatConversion)
+
+# Smallest frame (in pixels) worth converting on the GPU; below this the
+# upload and download cost more than the conversion saves
+GPU_CONVERT_MIN_PIXELS = 1280 * 720
 
+class CvQtConverter:
+    """
+    Converts BGR frames for display through a reused RGBA buffer.
+    
+    Qt paints 32-bit images without converting them, so each frame is
+    converted once by OpenCV into a buffer sized to the first frame and
+    reused for every following frame of the same size. Large frames can
+    optionally be converted on a CUDA device.
+    """
+    
+    def __init__(self, use_gpu=False):
+        """
+        Initialize the converter; buffers are allocated on first use.
+        
+        Args:
+            use_gpu: Convert frames of at least GPU_CONVERT_MIN_PIXELS on
+                the GPU when a CUDA device is available
+        """
+        self._rgba_buf = None
+        self._gpu_src = None
+        self._gpu_dst = None
+        self.set_use_gpu(use_gpu)
+    
+    def set_use_gpu(self, enabled):
+        """
+        Turn GPU conversion of large frames on or off.
+        
+        CUDA is only probed once a frame large enough to use it arrives,
+        so enabling this never loads the CUDA runtime up front.
+        
+        Args:
+            enabled: Whether large frames may be converted on the GPU
+        """
+        self._use_gpu = enabled
+        self._gpu_src = None
+        self._gpu_dst = None
+    
+    def to_image(self, cv_img):
+        """
+        Convert an OpenCV image to QImage.
+        
+        For BGR frames the QImage wraps the converter's buffer, so it is
+        only valid until the next call; convert it to a pixmap (or copy
+        it) before converting another frame.
+        
+        Args:
+            cv_img: OpenCV image (numpy array)
+            
+        Returns:
+            QImage object
+        """
+        # Grayscale and 4-channel images go through the generic path
+        if cv_img.ndim != 3 or cv_img.shape[2] != 3:
+            return cv_to_qt_image(cv_img)
+        
+        height, width = cv_img.shape[:2]
+        
+        if self._rgba_buf is None or self._rgba_buf.shape[:2] != (height, width):
+            self._rgba_buf = np.empty((height, width, 4), dtype=np.uint8)
+        
+        # Alpha is filled with 255, so the data is valid as premultiplied
+        if not (self._use_gpu and height * width >= GPU_CONVERT_MIN_PIXELS
+                and self._convert_gpu(cv_img)):
+            cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGBA, dst=self._rgba_buf)
+        
+        return QImage(self._rgba_buf.data, width, height, width * 4,
+                      QImage.Format.Format_RGBA8888_Premultiplied)
+    
+    def _convert_gpu(self, cv_img):
+        """
+        Convert a BGR frame into the RGBA buffer on the GPU.
+        
+        Args:
+            cv_img: BGR OpenCV image
+            
+        Returns:
+            True if converted, False if the CPU path should be used
+        """
+        try:
+            if self._gpu_src is None:
+                # First large frame: check for a device before allocating
+                if not cuda_available():
+                    self._use_gpu = False
+                    return False
+                
+                self._gpu_src = cv2.cuda_GpuMat()
+                self._gpu_dst = cv2.cuda_GpuMat()
+            
+            self._gpu_src.upload(cv_img)
+            cv2.cuda.cvtColor(self._gpu_src, cv2.COLOR_BGR2RGBA, self._gpu_dst)
+            self._gpu_dst.download(self._rgba_buf)
+            return True
+            
+        except Exception as e:
+            # Do not retry a failing device on every frame
+            logger.warning(f"GPU colour conversion failed, using CPU: {str(e)}")
+            self._use_gpu = False
+            return False
+    
+    def to_pixmap(self, cv_img):
+        """
+        Convert an OpenCV image to QPixmap.
+        
+        Args:
+            cv_img: OpenCV image (numpy array)
+            
+        Returns:
+            QPixmap object
+        """
+        return QPixmap.fromImage(self.to_image(cv_img),
+                                 Qt.ImageConversionFlag.NoFormatConversion)
+
+@lru_cache(maxsize=256)
 def get_icon(name, color=None):
     """
     Load an icon from the assets directory.
     
+    Icons are cached per (name, color), so rebuilt buttons and actions
+    share one QIcon; call get_icon.cache_clear() when the theme changes.
+    
     Args:
         name: Icon name
         color: Optional color name from COLORS dict
@@ -123,6 +284,44 @@ def show_question_message(parent, title, message):
     
     return reply == QMessageBox.StandardButton.Yes
 
+def show_question_message_async(parent, title, message, on_yes, on_no=None):
+    """
+    Show a question message dialog without blocking.
+    
+    Unlike show_question_message, no nested event loop is started, so
+    timers and camera updates keep running while the dialog is open.
+    
+    Args:
+        parent: Parent widget
+        title: Dialog title
+        message: Question message
+        on_yes: Callable invoked if the user clicks Yes
+        on_no: Optional callable invoked if the user clicks No or closes
+            the dialog
+        
+    Returns:
+        The open QMessageBox; keep a reference to it if parent is None
+    """
+    box = QMessageBox(
+        QMessageBox.Icon.Question, title, message,
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        parent
+    )
+    box.setDefaultButton(QMessageBox.StandardButton.No)
+    box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    
+    def on_finished(_result):
+        # Escape or the close button count as No
+        if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
+            on_yes()
+        elif on_no is not None:
+            on_no()
+    
+    box.finished.connect(on_finished)
+    box.open()
+    
+    return box
+
 def format_timestamp(timestamp):
     """
     Format a timestamp for display.
@@ -136,6 +335,19 @@ def format_timestamp(timestamp):
     if not timestamp:
         return "N/A"
     
+    return _format_timestamp_cached(timestamp)
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_cached(timestamp):
+    """
+    Parse and format a timestamp; tables redisplay the same ones often.
+    
+    Args:
+        timestamp: Non-empty timestamp string
+        
+    Returns:
+        Formatted timestamp string
+    """
     try:
         dt = datetime.fromisoformat(timestamp)
         return dt.strftime("%B %d, %Y %I:%M %p")
@@ -155,12 +367,23 @@ def format_duration(seconds):
     if seconds is None:
         return "N/A"
     
-    minutes, secs = divmod(seconds, 60)
-    if minutes < 60:
-        return f"{int(minutes)}:{int(secs):02d}"
-    else:
-        hours, minutes = divmod(minutes, 60)
-        return f"{int(hours)}:{int(minutes):02d}:{int(secs):02d}"
+    # Whole seconds are displayed, so cache on those
+    return _format_whole_seconds(int(seconds))
+
+@lru_cache(maxsize=1024)
+def _format_whole_seconds(seconds):
+    """
+    Format a whole number of seconds as M:SS or H:MM:SS.
+    
+    Args:
+        seconds: Duration in whole seconds
+        
+    Returns:
+        Formatted duration string
+    """
+    hours, rem = seconds // 3600, seconds % 3600
+    minutes, secs = rem // 60, rem % 60
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
 
 def get_score_color(score):
     """
@@ -172,14 +395,7 @@ def get_score_color(score):
     Returns:
         Color as string (hex code)
     """
-    if score >= 85:
-        return COLORS['secondary']  # Green for excellent
-    elif score >= 70:
-        return COLORS['primary']  # Blue for good
-    elif score >= 50:
-        return COLORS['warning']  # Orange for fair
-    else:
-        return COLORS['danger']  # Red for poor
+    return _SCORE_COLORS[bisect.bisect_right(_SCORE_CUTS, score)]
 
 def get_file_extension(filepath):
     """
@@ -191,7 +407,15 @@ def get_file_extension(filepath):
     Returns:
         Extension without dot
     """
-    return os.path.splitext(filepath)[1][1:].lower()
+    # Same result as os.path.splitext for these names, in two rfind scans
+    dot = filepath.rfind('.')
+    sep = max(filepath.rfind('/'), filepath.rfind('\\'))
+    
+    # Leading dots of the file name (dotfiles) do not start an extension
+    if dot <= sep + 1 or not filepath[sep + 1:dot].lstrip('.'):
+        return ''
+    
+    return filepath[dot + 1:].lower()
 
 def is_valid_image_file(filepath):
     """
@@ -203,8 +427,7 @@ def is_valid_image_file(filepath):
     Returns:
         True if valid image file, False otherwise
     """
-    valid_extensions = ['jpg', 'jpeg', 'png', 'bmp', 'gif']
-    return get_file_extension(filepath) in valid_extensions
+    return get_file_extension(filepath) in _IMAGE_EXTS
 
 def is_valid_video_file(filepath):
     """
@@ -216,8 +439,7 @@ def is_valid_video_file(filepath):
     Returns:
         True if valid video file, False otherwise
     """
-    valid_extensions = ['mp4', 'avi', 'mov', 'wmv', 'mkv']
-    return get_file_extension(filepath) in valid_extensions
+    return get_file_extension(filepath) in _VIDEO_EXTS
 
 def normalize_angle(angle):
     """
@@ -242,25 +464,39 @@ def angle_diff(a, b):
     Returns:
         Smallest angular difference
     """
-    a = normalize_angle(a)
-    b = normalize_angle(b)
+    # One modulo of the difference replaces normalizing both angles
+    diff = (a - b) % 360
+    return diff if diff <= 180 else 360 - diff
+
+def angle_diff_batch(a, b):
+    """
+    Calculate the smallest differences between two sets of angles.
     
-    diff = abs(a - b)
-    if diff > 180:
-        diff = 360 - diff
+    Vectorized counterpart of angle_diff() for comparing all joint angles
+    of a frame against their references in one call.
     
-    return diff
+    Args:
+        a: Array-like of angles in degrees
+        b: Array-like of angles in degrees, broadcastable against a
+        
+    Returns:
+        NumPy array of smallest angular differences (0-180 degrees)
+    """
+    diff = np.abs(np.mod(a, 360.0) - np.mod(b, 360.0))
+    return np.where(diff > 180.0, 360.0 - diff, diff)
 
+@lru_cache(maxsize=1)
 def get_system_info():
     """
     Get system information.
     
+    The result is cached; call get_system_info.cache_clear() to probe again.
+    CUDA support is reported separately by cuda_device_count(), since that
+    probe loads the CUDA runtime.
+    
     Returns:
-        Dictionary with system information
+        Read-only mapping with system information, shared by all callers
     """
-    import platform
-    import sys
-    
     system_info = {
         'os': platform.system(),
         'os_version': platform.version(),
@@ -272,12 +508,48 @@ def get_system_info():
     # Add OpenCV version
     system_info['opencv_version'] = cv2.__version__
     
-    # Try to get GPU info if available
+    # The cached object is shared, so do not let callers modify it
+    return MappingProxyType(system_info)
+
+@lru_cache(maxsize=1)
+def cuda_device_count():
+    """
+    Get the number of CUDA devices OpenCV can use.
+    
+    The first call loads the CUDA runtime, which can take hundreds of
+    milliseconds, so the result is cached; call
+    cuda_device_count.cache_clear() to probe again.
+    
+    Returns:
+        Number of CUDA-enabled devices, 0 if CUDA is unavailable
+    """
     try:
-        gpu_count = cv2.cuda.getCudaEnabledDeviceCount()
-        system_info['cuda_available'] = gpu_count > 0
-        system_info['cuda_devices'] = gpu_count
+        return cv2.cuda.getCudaEnabledDeviceCount()
     except Exception:
-        system_info['cuda_available'] = False
+        return 0
+
+def cuda_available():
+    """
+    Check whether OpenCV can use a CUDA device.
     
-    return system_info
\ No newline at end of file
+    Returns:
+        True if at least one CUDA-enabled device is present
+    """
+    return cuda_device_count() > 0
+
+def camera_backend():
+    """
+    Get the capture backend used to open cameras on this platform.
+    
+    Naming the backend avoids OpenCV trying (and enumerating devices
+    through) every backend in turn, which is slow on Windows. Every
+    camera capture must use it, since backends number devices differently.
+    
+    Returns:
+        OpenCV VideoCapture API preference
+    """
+    if sys.platform == 'win32':
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith('linux'):
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY